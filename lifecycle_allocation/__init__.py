@@ -2,13 +2,18 @@
 
 __version__ = "0.2.0"
 
-from lifecycle_allocation.core.allocation import alpha_star, recommended_stock_share
+from lifecycle_allocation.core.allocation import (
+    alpha_star,
+    batch_recommended_stock_share,
+    recommended_stock_share,
+)
 from lifecycle_allocation.core.human_capital import (
     INDUSTRY_BETAS,
     human_capital_pv,
     suggested_beta,
 )
 from lifecycle_allocation.core.models import (
+    AllocationComponents,
     AllocationResult,
     BenefitModelSpec,
     ConstraintsSpec,
@@ -23,6 +28,7 @@ from lifecycle_allocation.core.models import (
 from lifecycle_allocation.core.strategies import compare_strategies
 
 __all__ = [
+    "AllocationComponents",
     "AllocationResult",
     "BenefitModelSpec",
     "ConstraintsSpec",
@@ -34,6 +40,7 @@ __all__ = [
     "MarketAssumptions",
     "MortalitySpec",
     "alpha_star",
+    "batch_recommended_stock_share",
     "compare_strategies",
     "human_capital_pv",
     "recommended_stock_share",
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from pathlib import Path
 
 import click
 
+try:
+    # Optional accelerator: install via `pip install lifecycle-allocation[speed]`.
+    # Used for JSON output when available; stdlib json is the fallback.
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only when orjson is missing
+    _HAS_ORJSON = False
+
 from lifecycle_allocation.core.allocation import recommended_stock_share
 from lifecycle_allocation.core.human_capital import suggested_beta
-from lifecycle_allocation.core.models import ConstraintsSpec, HumanCapitalSpec, MarketAssumptions
+from lifecycle_allocation.core.models import ConstraintsSpec, HumanCapitalSpec
 from lifecycle_allocation.core.strategies import compare_strategies
 from lifecycle_allocation.io.loaders import load_profile
-from lifecycle_allocation.viz.charts import plot_balance_sheet, plot_strategy_bars
 
 
 @click.group()
@@ -70,52 +79,28 @@ def alloc(
         beta_val = hc_beta
         if beta_val is None and hc_industry is not None:
             beta_val = suggested_beta(hc_industry)
-        profile.human_capital_model = HumanCapitalSpec(
-            beta=beta_val if beta_val is not None else 0.0,
-            industry=hc_industry or profile.human_capital_model.industry,
+        profile = dataclasses.replace(
+            profile,
+            human_capital_model=HumanCapitalSpec(
+                beta=beta_val if beta_val is not None else 0.0,
+                industry=hc_industry or profile.human_capital_model.industry,
+            ),
         )
 
-    # Apply CLI overrides to market assumptions. Each flag, if provided,
-    # replaces the corresponding value from the YAML profile.
-    if mu is not None:
-        market = MarketAssumptions(
-            mu=mu,
-            r=market.r,
-            sigma=market.sigma,
-            real=market.real,
-            borrowing_spread=market.borrowing_spread,
-        )
-    if risk_free is not None:
-        market = MarketAssumptions(
-            mu=market.mu,
-            r=risk_free,
-            sigma=market.sigma,
-            real=market.real,
-            borrowing_spread=market.borrowing_spread,
+    # Apply CLI overrides to market assumptions. Collect the provided flags
+    # and rebuild the dataclass once instead of once per flag.
+    overrides: dict[str, float | bool] = {
+        k: v
+        for k, v in (
+            ("mu", mu),
+            ("r", risk_free),
+            ("sigma", sigma),
+            ("borrowing_spread", borrowing_spread),
         )
-    if sigma is not None:
-        market = MarketAssumptions(
-            mu=market.mu,
-            r=market.r,
-            sigma=sigma,
-            real=market.real,
-            borrowing_spread=market.borrowing_spread,
-        )
-    if borrowing_spread is not None:
-        market = MarketAssumptions(
-            mu=market.mu,
-            r=market.r,
-            sigma=market.sigma,
-            real=market.real,
-            borrowing_spread=borrowing_spread,
-        )
-    market = MarketAssumptions(
-        mu=market.mu,
-        r=market.r,
-        sigma=market.sigma,
-        real=real,
-        borrowing_spread=market.borrowing_spread,
-    )
+        if v is not None
+    }
+    overrides["real"] = real
+    market = dataclasses.replace(market, **overrides)
 
     # Merge leverage constraints from CLI flags and YAML profile
     if allow_leverage or constraints.allow_leverage:
@@ -146,24 +131,56 @@ def alloc(
             k: v for k, v in result.components.items() if isinstance(v, (int, float, bool, str))
         },
     }
-    with open(out / "allocation.json", "w") as f:
-        json.dump(alloc_data, f, indent=2)
-
-    # Write summary.md
-    with open(out / "summary.md", "w") as f:
-        f.write("# Lifecycle Allocation Summary\n\n")
-        f.write(result.explain)
-        f.write("\n\n## Strategy Comparison\n\n")
-        f.write("| Strategy | Allocation |\n|---|---|\n")
-        for _, row in comparison_df.iterrows():
-            f.write(f"| {row['strategy']} | {row['allocation']:.1%} |\n")
+    if _HAS_ORJSON:
+        # OPT_SERIALIZE_NUMPY handles numpy scalars from the vectorized
+        # human capital path without manual float() casts.
+        (out / "allocation.json").write_bytes(
+            orjson.dumps(alloc_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        with open(out / "allocation.json", "w") as f:
+            json.dump(alloc_data, f, indent=2)
+
+    # Write summary.md -- assemble the document in memory and write it once
+    lines = [
+        "# Lifecycle Allocation Summary",
+        "",
+        result.explain,
+        "",
+        "## Strategy Comparison",
+        "",
+        "| Strategy | Allocation |",
+        "|---|---|",
+    ]
+    # to_numpy() gives plain arrays, so the zip iterates without per-row
+    # pandas object allocation
+    lines.extend(
+        f"| {strategy} | {allocation:.1%} |"
+        for strategy, allocation in zip(
+            comparison_df["strategy"].to_numpy(), comparison_df["allocation"].to_numpy()
+        )
+    )
+    (out / "summary.md").write_text("\n".join(lines) + "\n")
 
     click.echo(f"Recommended stock allocation: {result.alpha_recommended:.1%}")
     click.echo(f"Results written to {out}")
 
     if report:
+        # Imported here so the common no-report path never pays the
+        # matplotlib import cost (hundreds of ms and tens of MB)
+        from lifecycle_allocation.viz.charts import (
+            ChartRenderer,
+            plot_balance_sheet,
+            plot_strategy_bars,
+        )
+
         charts_dir = out / "charts"
         charts_dir.mkdir(exist_ok=True)
-        plot_balance_sheet(result, profile, save_path=charts_dir / f"balance_sheet.{img_format}")
-        plot_strategy_bars(comparison_df, save_path=charts_dir / f"strategy_bars.{img_format}")
+        # One figure serves both charts; the renderer clears the axes
+        # between saves instead of rebuilding figure machinery twice
+        with ChartRenderer() as renderer:
+            plot_balance_sheet(result, profile, ax=renderer.ax)
+            renderer.save(charts_dir / f"balance_sheet.{img_format}")
+            plot_strategy_bars(comparison_df, ax=renderer.ax)
+            renderer.save(charts_dir / f"strategy_bars.{img_format}")
         click.echo(f"Charts written to {charts_dir}")
@@ -0,0 +1,46 @@
+"""Optional numba-compiled income kernels.
+
+Numba is an optional accelerator (install via
+``pip install lifecycle-allocation[speed]``). When it is missing this
+module only exposes ``HAS_NUMBA = False`` and callers use the NumPy paths.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only when numba is missing
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def cgm_income_vec(
+        ages: np.ndarray,
+        c0: float,
+        c1: float,
+        c2: float,
+        c3: float,
+        base_income: float,
+        anchor_log: float,
+        retirement_age: float,
+    ) -> np.ndarray:
+        """Evaluate the anchored CGM income cubic over an age vector.
+
+        Horner-form loop that LLVM auto-vectorizes; ages at or beyond
+        retirement map to 0, matching ``expected_income``.
+        """
+        out = np.empty(ages.shape[0])
+        for i in range(ages.shape[0]):
+            if ages[i] < retirement_age:
+                x = ages[i] * 0.1
+                log_income = c0 + x * (c1 + x * (c2 + x * c3))
+                out[i] = base_income * np.exp(log_income - anchor_log)
+            else:
+                out[i] = 0.0
+        return out
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
 
 from lifecycle_allocation.core.explain import build_explanation
 from lifecycle_allocation.core.human_capital import human_capital_pv
 from lifecycle_allocation.core.models import (
+    AllocationComponents,
     AllocationResult,
     ConstraintsSpec,
     DiscountCurveSpec,
@@ -15,6 +20,11 @@ from lifecycle_allocation.core.models import (
 )
 
 
+def _clip(x: float, lo: float, hi: float) -> float:
+    """Clamp x to [lo, hi] with a single ternary instead of max(min(...))."""
+    return lo if x < lo else (hi if x > hi else x)
+
+
 def alpha_star(
     market: MarketAssumptions,
     gamma: float,
@@ -63,30 +73,56 @@ def alpha_star(
     if constraints is None:
         constraints = ConstraintsSpec()
 
-    sigma_sq = market.sigma**2
+    # alpha_star is a pure function of a few scalars but sits on the hot
+    # path of every sweep, so delegate to a memoized helper keyed on the
+    # unpacked (hashable) inputs.
+    return _alpha_star_cached(
+        market.mu,
+        market.r,
+        market.sigma,
+        market.borrowing_spread,
+        gamma,
+        constraints.allow_leverage,
+        constraints.max_leverage,
+        variant,
+    )
+
+
+@lru_cache(maxsize=256)
+def _alpha_star_cached(
+    mu: float,
+    r: float,
+    sigma: float,
+    borrowing_spread: float,
+    gamma: float,
+    allow_leverage: bool,
+    max_leverage: float,
+    variant: str,
+) -> tuple[float, bool, float]:
+    """Memoized two-tier alpha_star computation on scalar inputs."""
+    sigma_sq = sigma**2
 
     if variant == "merton":
-        equity_premium = market.mu - market.r
+        equity_premium = mu - r
     elif variant == "log_return":
-        equity_premium = math.log(1 + market.mu) - math.log(1 + market.r) + 0.5 * sigma_sq
+        equity_premium = math.log1p(mu) - math.log1p(r) + 0.5 * sigma_sq
     else:
         raise ValueError(f"Unknown alpha_star variant: {variant}")
 
     # Step 1: Compute the unleveraged (lending-rate) optimal allocation
     alpha_unlev = equity_premium / (gamma * sigma_sq)
 
-    if alpha_unlev <= 1.0 or not constraints.allow_leverage:
+    if alpha_unlev <= 1.0 or not allow_leverage:
         # Lending regime: no borrowing needed, clamp to [0, 1]
-        clamped = max(0.0, min(alpha_unlev, 1.0))
-        return clamped, False, 0.0
+        return _clip(alpha_unlev, 0.0, 1.0), False, 0.0
 
     # Step 2: Unleveraged alpha > 1 and leverage allowed -- switch to
     # the borrowing rate (r_b = r + spread) to compute the leveraged alpha
-    r_b = market.r + market.borrowing_spread
+    r_b = r + borrowing_spread
     if variant == "merton":
-        equity_premium_lev = market.mu - r_b
+        equity_premium_lev = mu - r_b
     else:
-        equity_premium_lev = math.log(1 + market.mu) - math.log(1 + r_b) + 0.5 * sigma_sq
+        equity_premium_lev = math.log1p(mu) - math.log1p(r_b) + 0.5 * sigma_sq
 
     alpha_lev = equity_premium_lev / (gamma * sigma_sq)
 
@@ -100,7 +136,7 @@ def alpha_star(
 
     # Step 3b: Leverage is still optimal after accounting for borrowing cost.
     # Cap at the user's maximum leverage constraint.
-    result = min(alpha_lev, constraints.max_leverage)
+    result = min(alpha_lev, max_leverage)
     return result, True, drag
 
 
@@ -171,31 +207,31 @@ def recommended_stock_share(
 
     # Clamp
     upper = constraints.max_leverage if constraints.allow_leverage else 1.0
-    alpha_recommended = max(0.0, min(alpha_unconstrained, upper))
+    alpha_recommended = _clip(alpha_unconstrained, 0.0, upper)
 
     # Check if the final result actually uses leverage
     final_leverage = leverage_applied and alpha_recommended > 1.0
 
     # Assemble all intermediate values for the explanation builder and
     # for user inspection via AllocationResult.components
-    components = {
-        "human_capital": h,
-        "human_capital_beta": beta_h,
-        "human_capital_bond_like": h_bond,
-        "human_capital_equity_like": h_equity,
-        "investable_wealth": w,
-        "hw_ratio": h / w,
-        "gamma": gamma,
-        "alpha_star": a_star,
-        "alpha_unconstrained": alpha_unconstrained,
-        "alpha_recommended": alpha_recommended,
-        "leverage_applied": final_leverage,
-        "borrowing_cost_drag": drag,
-        "mu": market.mu,
-        "r": market.r,
-        "sigma": market.sigma,
-        "borrowing_spread": market.borrowing_spread,
-    }
+    components = AllocationComponents(
+        human_capital=h,
+        human_capital_beta=beta_h,
+        human_capital_bond_like=h_bond,
+        human_capital_equity_like=h_equity,
+        investable_wealth=w,
+        hw_ratio=h / w,
+        gamma=gamma,
+        alpha_star=a_star,
+        alpha_unconstrained=alpha_unconstrained,
+        alpha_recommended=alpha_recommended,
+        leverage_applied=final_leverage,
+        borrowing_cost_drag=drag,
+        mu=market.mu,
+        r=market.r,
+        sigma=market.sigma,
+        borrowing_spread=market.borrowing_spread,
+    )
 
     explain = build_explanation(components, constraints)
 
@@ -207,5 +243,69 @@ def recommended_stock_share(
         leverage_applied=final_leverage,
         borrowing_cost_drag=drag,
         explain=explain,
-        components=components,
+        components_struct=components,
     )
+
+
+def batch_recommended_stock_share(
+    profiles: Sequence[InvestorProfile],
+    markets: Sequence[MarketAssumptions] | MarketAssumptions,
+    curve: DiscountCurveSpec | None = None,
+    constraints: ConstraintsSpec | None = None,
+    *,
+    t_max: int = 100,
+    variant: str = "merton",
+) -> np.ndarray:
+    """Evaluate recommended allocations for many profile/market pairs.
+
+    Sweep-oriented companion to ``recommended_stock_share()``: computes only
+    the final clamped allocation per pair, skipping the explanation text and
+    components assembly that dominate per-call overhead in large parameter
+    studies. The ``alpha_star`` memoization and the cached discount/survival
+    vectors are shared across the whole batch.
+
+    Parameters
+    ----------
+    profiles : sequence of InvestorProfile
+        One profile per sweep point.
+    markets : MarketAssumptions or sequence of MarketAssumptions
+        A single set of market assumptions shared by every profile, or one
+        per profile (must match ``profiles`` in length).
+    curve : DiscountCurveSpec or None
+        Discount curve for human capital PV. Defaults to constant 2%.
+    constraints : ConstraintsSpec or None
+        Allocation constraints applied to every pair.
+    t_max : int
+        Maximum age for human capital computation (default 100).
+    variant : str
+        Calculation variant passed to ``alpha_star()``.
+
+    Returns
+    -------
+    np.ndarray
+        Array of recommended allocations, one per profile.
+    """
+    if curve is None:
+        curve = DiscountCurveSpec()
+    if constraints is None:
+        constraints = ConstraintsSpec()
+
+    if isinstance(markets, MarketAssumptions):
+        market_seq: Sequence[MarketAssumptions] = [markets] * len(profiles)
+    else:
+        if len(markets) != len(profiles):
+            raise ValueError(
+                f"markets length {len(markets)} does not match profiles length {len(profiles)}"
+            )
+        market_seq = markets
+
+    upper = constraints.max_leverage if constraints.allow_leverage else 1.0
+    out = np.empty(len(profiles))
+
+    for i, (profile, market) in enumerate(zip(profiles, market_seq)):
+        a_star, _, _ = alpha_star(market, profile.gamma, constraints, variant=variant)
+        h = human_capital_pv(profile, curve, t_max=t_max)
+        h_bond = (1.0 - profile.human_capital_model.beta) * h
+        out[i] = _clip(a_star * (1.0 + h_bond / profile.investable_wealth), 0.0, upper)
+
+    return out
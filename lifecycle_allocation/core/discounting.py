@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
+
 from lifecycle_allocation.core.models import DiscountCurveSpec
 
 
+@lru_cache(maxsize=64)
+def _constant_discount_vector(from_age: int, max_age: int, rate: float) -> np.ndarray:
+    """Precompute (1+rate)^n for n = 1..(max_age - from_age).
+
+    The vector is identical across every human capital evaluation with the
+    same (from_age, horizon, rate), so build it once and share it. The
+    returned array is marked read-only because it is cached.
+    """
+    factors = np.power(1.0 + rate, np.arange(1, max_age - from_age + 1))
+    factors.flags.writeable = False
+    return factors
+
+
 def discount_factor(from_age: int, to_age: int, curve: DiscountCurveSpec) -> float:
     """Compute the discount factor D(from_age -> to_age).
 
@@ -19,3 +36,21 @@ def discount_factor(from_age: int, to_age: int, curve: DiscountCurveSpec) -> flo
         return (1.0 + curve.rate) ** n
 
     raise ValueError(f"Unknown discount curve type: {curve.type}")
+
+
+def discount_factor_vec(
+    from_age: int, to_ages: np.ndarray, curve: DiscountCurveSpec
+) -> np.ndarray:
+    """Compute discount factors D(from_age -> to_age) for an array of ages.
+
+    Vectorized counterpart of ``discount_factor()``. For a constant curve
+    the full factor vector is cached per (from_age, horizon, rate), so
+    repeated allocation calls reuse one precomputed array.
+    """
+    if curve.type == "constant":
+        if to_ages.size == 0:
+            return np.empty(0)
+        factors = _constant_discount_vector(from_age, int(to_ages.max()), curve.rate)
+        return factors[to_ages - from_age - 1]
+
+    raise ValueError(f"Unknown discount curve type: {curve.type}")
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from lifecycle_allocation.core.models import ConstraintsSpec
+from lifecycle_allocation.core.models import AllocationComponents, ConstraintsSpec
 
 LEVERAGE_DISCLOSURES = [
     (
@@ -32,21 +30,25 @@ LEVERAGE_DISCLOSURES = [
     ),
 ]
 
+# Bound str.format reuse skips re-parsing the money format spec per call
+_fmt_money = "${:,.0f}".format
+
+# The numbered disclosure block is constant, so format it once at import time
+_LEVERAGE_DISCLOSURES_BLOCK = "\n".join(
+    f"{i}. {disclosure}" for i, disclosure in enumerate(LEVERAGE_DISCLOSURES, 1)
+)
+
 
-def build_explanation(components: dict[str, Any], constraints: ConstraintsSpec | None) -> str:
+def build_explanation(
+    components: AllocationComponents, constraints: ConstraintsSpec | None
+) -> str:
     """Build a human-readable explanation of the allocation result.
 
     Parameters
     ----------
-    components : dict
-        Intermediate computation values. Expected keys:
-
-        - ``human_capital`` (float): PV of future earnings/benefits
-        - ``investable_wealth`` (float): current financial wealth
-        - ``alpha_star`` (float): baseline risky share
-        - ``alpha_unconstrained`` (float): allocation before clamping
-        - ``alpha_recommended`` (float): final clamped allocation
-        - ``leverage_applied`` (bool): whether leverage is in the result
+    components : AllocationComponents
+        Intermediate computation values (human capital, wealth, alpha_star,
+        clamped and unclamped allocations, leverage flags).
     constraints : ConstraintsSpec or None
         Allocation constraints, used to determine if leverage disclosures
         should be included.
@@ -59,31 +61,31 @@ def build_explanation(components: dict[str, Any], constraints: ConstraintsSpec |
     """
     lines: list[str] = []
 
-    h = components.get("human_capital", 0.0)
-    w = components.get("investable_wealth", 0.0)
+    h = components.human_capital
+    w = components.investable_wealth
     hw_ratio = h / w if w > 0 else 0.0
-    a_star = components.get("alpha_star", 0.0)
-    a_unconstrained = components.get("alpha_unconstrained", 0.0)
-    a_recommended = components.get("alpha_recommended", 0.0)
-    leverage_applied = components.get("leverage_applied", False)
+    a_star = components.alpha_star
+    a_unconstrained = components.alpha_unconstrained
+    a_recommended = components.alpha_recommended
+    leverage_applied = components.leverage_applied
 
     lines.append("=== Lifecycle Allocation Explanation ===")
     lines.append("")
-    lines.append(f"Financial wealth (W): ${w:,.0f}")
-    lines.append(f"Human capital (H):    ${h:,.0f}")
-    lines.append(f"Total wealth (W+H):   ${w + h:,.0f}")
+    lines.append(f"Financial wealth (W): {_fmt_money(w)}")
+    lines.append(f"Human capital (H):    {_fmt_money(h)}")
+    lines.append(f"Total wealth (W+H):   {_fmt_money(w + h)}")
     lines.append(f"H/W ratio:            {hw_ratio:.2f}")
     lines.append("")
     lines.append(f"Baseline risky share (alpha*): {a_star:.1%}")
 
-    beta_h = components.get("human_capital_beta", 0.0)
-    h_bond = components.get("human_capital_bond_like", h)
-    h_equity = components.get("human_capital_equity_like", 0.0)
+    beta_h = components.human_capital_beta
+    h_bond = components.human_capital_bond_like
+    h_equity = components.human_capital_equity_like
 
     if beta_h > 0:
         lines.append(f"Human capital beta: {beta_h:.2f} (equity-like fraction)")
-        lines.append(f"  Bond-like H: ${h_bond:,.0f} ({(1 - beta_h):.0%})")
-        lines.append(f"  Equity-like H: ${h_equity:,.0f} ({beta_h:.0%})")
+        lines.append(f"  Bond-like H: {_fmt_money(h_bond)} ({(1 - beta_h):.0%})")
+        lines.append(f"  Equity-like H: {_fmt_money(h_equity)} ({beta_h:.0%})")
 
     if hw_ratio > 0:
         if beta_h > 0:
@@ -125,8 +127,7 @@ def build_explanation(components: dict[str, Any], constraints: ConstraintsSpec |
     if leverage_applied and a_recommended > 1.0:
         lines.append("")
         lines.append("--- Leverage Risk Disclosures ---")
-        for i, disclosure in enumerate(LEVERAGE_DISCLOSURES, 1):
-            lines.append(f"{i}. {disclosure}")
+        lines.append(_LEVERAGE_DISCLOSURES_BLOCK)
 
     lines.append("")
     lines.append(
@@ -2,14 +2,56 @@
 
 from __future__ import annotations
 
-from lifecycle_allocation.core.discounting import discount_factor
-from lifecycle_allocation.core.income_models import expected_income
+import numpy as np
+
+from lifecycle_allocation.core.discounting import discount_factor_vec
+from lifecycle_allocation.core.income_models import build_income_table
 from lifecycle_allocation.core.models import (
     BenefitModelSpec,
     DiscountCurveSpec,
     InvestorProfile,
 )
-from lifecycle_allocation.core.mortality import survival_prob
+from lifecycle_allocation.core.mortality import survival_prob_vec
+
+try:
+    # Optional accelerator: install via `pip install lifecycle-allocation[speed]`.
+    # When absent, the vectorized NumPy path below is used instead.
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only when numba is missing
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _hc_pv_kernel(
+        current_age: int,
+        t_max: int,
+        retirement_age: int,
+        base_income: float,
+        g: float,
+        benefit: float,
+        rate: float,
+    ) -> float:
+        """JIT-compiled scalar reduction for the common human capital case.
+
+        Covers flat/growth income, none/flat benefits, no mortality, and a
+        constant discount curve. Written as an explicit accumulator loop,
+        which Numba compiles more efficiently than the vectorized form.
+        """
+        pv = 0.0
+        for age in range(current_age + 1, t_max + 1):
+            if age < retirement_age:
+                cf = base_income * (1.0 + g) ** (age - current_age)
+            else:
+                cf = benefit
+            if cf <= 0.0:
+                continue
+            pv += cf / (1.0 + rate) ** (age - current_age)
+        return pv
+
 
 # Industry beta calibration table.
 # Values reflect the fraction of human capital that behaves like equity,
@@ -100,6 +142,45 @@ def expected_benefit(age: int, spec: BenefitModelSpec, profile: InvestorProfile)
     raise ValueError(f"Unknown benefit model type: {spec.type}")
 
 
+def expected_benefit_vec(
+    ages: np.ndarray, spec: BenefitModelSpec, profile: InvestorProfile
+) -> np.ndarray:
+    """Compute expected retirement benefits for an array of ages.
+
+    Vectorized counterpart of ``expected_benefit()``. Ages below
+    ``profile.retirement_age`` map to 0, as does a ``"none"`` benefit model.
+
+    Parameters
+    ----------
+    ages : np.ndarray
+        Integer ages at which to compute benefits.
+    spec : BenefitModelSpec
+        Benefit model specification (type, annual_benefit, replacement_rate).
+    profile : InvestorProfile
+        Investor profile, used for retirement_age and after_tax_income.
+
+    Returns
+    -------
+    np.ndarray
+        Expected annual benefit amount in dollars, one entry per age.
+    """
+    retired = ages >= profile.retirement_age
+
+    if spec.type == "none":
+        return np.zeros(ages.shape)
+
+    if spec.type == "flat":
+        if spec.annual_benefit > 0:
+            benefit = spec.annual_benefit
+        else:
+            # Use replacement rate on income
+            base_income = profile.after_tax_income or 0.0
+            benefit = base_income * spec.replacement_rate
+        return np.where(retired, benefit, 0.0)
+
+    raise ValueError(f"Unknown benefit model type: {spec.type}")
+
+
 def human_capital_pv(
     profile: InvestorProfile,
     curve: DiscountCurveSpec | None = None,
@@ -135,28 +216,68 @@ def human_capital_pv(
     - **Post-retirement** (age >= retirement_age): cash flow = expected benefit
 
     Each future cash flow is multiplied by the survival probability and
-    divided by the discount factor. Ages with zero or negative cash flow
-    are skipped.
+    divided by the discount factor. Negative cash flows are clipped to 0.
+
+    The summation is a single vectorized NumPy pass over all future ages
+    rather than a Python-level loop, so cost is dominated by a handful of
+    array operations regardless of the horizon length.
     """
     if curve is None:
         curve = DiscountCurveSpec()
 
     current_age = profile.age
-    pv = 0.0
 
-    for future_age in range(current_age + 1, t_max + 1):
-        # Get cash flow for this age
-        if future_age < profile.retirement_age:
-            cf = expected_income(future_age, profile.income_model, profile)
+    # Short-circuit cases where every cash flow is trivially zero:
+    # already retired with no benefit model, or no stated income feeding
+    # the flat/growth/profile models (csv reads income from the file).
+    if profile.benefit_model.type == "none":
+        if current_age >= profile.retirement_age:
+            return 0.0
+        if profile.income_model.type != "csv" and not profile.after_tax_income:
+            return 0.0
+
+    # Fast path: dispatch the common scalar case to the JIT-compiled kernel
+    # when numba is installed. The kernel takes only scalars, so unpack the
+    # specs here; anything it cannot represent falls through to NumPy.
+    if (
+        _HAS_NUMBA
+        and profile.income_model.type in ("flat", "growth")
+        and profile.benefit_model.type in ("none", "flat")
+        and profile.mortality_model.type == "none"
+        and curve.type == "constant"
+    ):
+        base_income = profile.after_tax_income or 0.0
+        g = profile.income_model.g if profile.income_model.type == "growth" else 0.0
+        if profile.benefit_model.type == "none":
+            benefit = 0.0
+        elif profile.benefit_model.annual_benefit > 0:
+            benefit = profile.benefit_model.annual_benefit
         else:
-            cf = expected_benefit(future_age, profile.benefit_model, profile)
+            benefit = base_income * profile.benefit_model.replacement_rate
+        return float(
+            _hc_pv_kernel(
+                current_age,
+                t_max,
+                profile.retirement_age,
+                base_income,
+                g,
+                benefit,
+                curve.rate,
+            )
+        )
 
-        if cf <= 0:
-            continue
+    ages = np.arange(current_age + 1, t_max + 1)
+    if ages.size == 0:
+        return 0.0
 
-        s = survival_prob(current_age, future_age, profile.mortality_model)
-        d = discount_factor(current_age, future_age, curve)
+    # Cash flows: income pre-retirement, benefits post-retirement
+    pre = ages < profile.retirement_age
+    income = build_income_table(profile, ages)
+    benefit = expected_benefit_vec(ages, profile.benefit_model, profile)
+    cf = np.where(pre, income, benefit)
+    cf = np.clip(cf, 0.0, None)
 
-        pv += cf * s / d
+    s = survival_prob_vec(current_age, ages, profile.mortality_model)
+    d = discount_factor_vec(current_age, ages, curve)
 
-    return pv
+    return float((cf * s / d).sum())
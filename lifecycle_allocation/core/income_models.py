@@ -2,32 +2,168 @@
 
 from __future__ import annotations
 
+import csv
 import math
+import os
+from functools import lru_cache
 
-import pandas as pd
+import numpy as np
 
+from lifecycle_allocation.core import _income_kernels
 from lifecycle_allocation.core.models import IncomeModelSpec, InvestorProfile
 
 # CGM education-level polynomial coefficients from Cocco, Gomes, Maenhout (2005).
 # Income = exp(a0 + a1*age + a2*age^2 + a3*age^3)
 # These are for log-income as a function of age/10.
-CGM_COEFFICIENTS: dict[str, list[float]] = {
-    "no_hs": [-2.1700, 2.7004, -0.1682, -0.0323],
-    "hs": [-2.1700, 2.7004, -0.1682, -0.0323],
-    "college": [-4.3148, 5.3810, -0.1682, -0.0323],
+CGM_COEFFICIENTS: dict[str, tuple[float, float, float, float]] = {
+    "no_hs": (-2.1700, 2.7004, -0.1682, -0.0323),
+    "hs": (-2.1700, 2.7004, -0.1682, -0.0323),
+    "college": (-4.3148, 5.3810, -0.1682, -0.0323),
 }
 
+# The same coefficients frozen into one contiguous float64 table so the
+# vectorized and JIT paths take a typed row without per-call conversion.
+# CGM_COEFFICIENTS above stays the public form.
+_CGM_INDEX: dict[str, int] = {"no_hs": 0, "hs": 1, "college": 2}
+_CGM_TABLE = np.array([CGM_COEFFICIENTS[k] for k in _CGM_INDEX], dtype=np.float64)
+_CGM_TABLE.flags.writeable = False
 
-def _cgm_log_income(age: int, coefficients: list[float]) -> float:
+
+@lru_cache(maxsize=32)
+def _load_income_csv(path: str, mtime: float) -> tuple[np.ndarray, np.ndarray]:
+    """Read and sort an age/income CSV once per (path, mtime).
+
+    A human capital integration looks up dozens of ages from the same file,
+    so cache the parsed, age-sorted arrays. ``mtime`` is part of the key so
+    an edited file is re-read. The files this branch expects are tiny
+    two-column tables, so the stdlib csv module plus ``np.fromiter`` avoids
+    the full pandas parsing pipeline. The arrays are marked read-only
+    because they are shared across calls.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "age" not in header or "income" not in header:
+            raise ValueError("CSV must have 'age' and 'income' columns")
+        age_idx = header.index("age")
+        income_idx = header.index("income")
+        rows = [(int(row[age_idx]), float(row[income_idx])) for row in reader if row]
+    rows.sort()
+    ages = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    incomes = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+    ages.flags.writeable = False
+    incomes.flags.writeable = False
+    return ages, incomes
+
+
+def _cgm_log_income(age: int, coefficients: tuple[float, ...] | list[float]) -> float:
     """Compute log-income from polynomial coefficients (age scaled by /10)."""
-    x = age / 10.0
-    return coefficients[0] + coefficients[1] * x + coefficients[2] * x**2 + coefficients[3] * x**3
+    c0, c1, c2, c3 = coefficients
+    x = age * 0.1
+    return c0 + x * (c1 + x * (c2 + x * c3))
+
+
+@lru_cache(maxsize=256)
+def _cgm_anchor(age: int, coefficients: tuple[float, ...]) -> float:
+    """Memoized log-income at the investor's current age.
+
+    The anchor term is identical for every target age in a human capital
+    loop, so cache it per (age, coefficients).
+    """
+    return _cgm_log_income(age, coefficients)
+
+
+# Keys into the spec/profile tuples built by expected_income(); the
+# handlers below take the tuples rather than the dataclasses because the
+# cached layer must operate on hashable keys.
+_SpecKey = tuple[str, float, "str | None", "tuple[float, ...] | None", "str | None"]
+_ProfileKey = tuple[int, int, float]
+
+
+def _income_flat(age: int, spec_key: _SpecKey, profile_key: _ProfileKey, mtime: float) -> float:
+    """Constant income at the stated after-tax level."""
+    return profile_key[2]
+
+
+def _income_growth(age: int, spec_key: _SpecKey, profile_key: _ProfileKey, mtime: float) -> float:
+    """Income compounding at a constant real growth rate from current age."""
+    current_age, _, base_income = profile_key
+    return base_income * (1.0 + spec_key[1]) ** (age - current_age)
+
+
+def _income_profile(age: int, spec_key: _SpecKey, profile_key: _ProfileKey, mtime: float) -> float:
+    """CGM education-polynomial income, anchored to current stated income."""
+    _, _, education, coefficients, _ = spec_key
+    current_age, _, base_income = profile_key
+
+    coeffs: tuple[float, ...] | np.ndarray | None = coefficients
+    if coeffs is None:
+        edu = education or "college"
+        if edu not in _CGM_INDEX:
+            raise ValueError(f"Unknown education level: {edu}")
+        coeffs = _CGM_TABLE[_CGM_INDEX[edu]]
+
+    # Scale so that the profile matches the user's stated income at current age
+    log_income_at_current = _cgm_anchor(current_age, tuple(coeffs))
+    log_income_at_age = _cgm_log_income(age, coeffs)
+    ratio = math.exp(log_income_at_age - log_income_at_current)
+    return base_income * ratio
+
+
+def _income_csv(age: int, spec_key: _SpecKey, profile_key: _ProfileKey, mtime: float) -> float:
+    """Income interpolated from a user-supplied age/income CSV."""
+    path = spec_key[4]
+    if path is None:
+        raise ValueError("CSV income model requires a 'path' to the CSV file")
+    ages, incomes = _load_income_csv(str(path), mtime)
+    # Ages outside the CSV range return 0 (no extrapolation)
+    if age < ages[0] or age > ages[-1]:
+        return 0.0
+    # Bisect into the sorted table: exact hit or linear interpolation
+    idx = int(np.searchsorted(ages, age))
+    if ages[idx] == age:
+        return float(incomes[idx])
+    return float(np.interp(age, ages, incomes))
+
+
+# Dispatch table resolved once at import; a dict lookup on spec.type
+# replaces the if/elif chain on the hot path and makes the set of income
+# models extensible by registration.
+_INCOME_HANDLERS = {
+    "flat": _income_flat,
+    "growth": _income_growth,
+    "profile": _income_profile,
+    "csv": _income_csv,
+}
+
+
+@lru_cache(maxsize=4096)
+def _expected_income_cached(
+    age: int,
+    spec_key: _SpecKey,
+    profile_key: _ProfileKey,
+    mtime: float,
+) -> float:
+    """Memoized income computation keyed on the inputs that matter.
+
+    ``expected_income()`` is pure given ``(age, spec fields, current age,
+    retirement age, base income)``, so cache on exactly that tuple rather
+    than on the full profile object. ``mtime`` participates in the key only
+    for the CSV model so an edited file invalidates its entries.
+    """
+    try:
+        handler = _INCOME_HANDLERS[spec_key[0]]
+    except KeyError:
+        raise ValueError(f"Unknown income model type: {spec_key[0]}") from None
+    return handler(age, spec_key, profile_key, mtime)
 
 
 def expected_income(age: int, spec: IncomeModelSpec, profile: InvestorProfile) -> float:
     """Compute expected income at a given age.
 
-    Returns 0 if age >= retirement_age.
+    Returns 0 if age >= retirement_age. Delegates to a memoized helper
+    keyed on ``IncomeModelSpec._key()`` plus the relevant profile fields,
+    so repeated sweeps over the same income model hit a cache.
 
     Parameters
     ----------
@@ -47,49 +183,137 @@ def expected_income(age: int, spec: IncomeModelSpec, profile: InvestorProfile) -
     if age >= profile.retirement_age:
         return 0.0
 
+    mtime = 0.0
+    if spec.type == "csv" and spec.path is not None:
+        mtime = os.path.getmtime(spec.path)
+    profile_key = (profile.age, profile.retirement_age, profile.after_tax_income or 0.0)
+    return _expected_income_cached(age, spec._key(), profile_key, mtime)
+
+
+def expected_income_vec(
+    ages: np.ndarray, spec: IncomeModelSpec, profile: InvestorProfile
+) -> np.ndarray:
+    """Compute expected income for an array of ages in one vectorized pass.
+
+    Vectorized counterpart of ``expected_income()``. Ages at or beyond
+    ``profile.retirement_age`` map to 0. The ``"csv"`` model falls back to
+    per-age scalar evaluation since it depends on file lookups.
+
+    Parameters
+    ----------
+    ages : np.ndarray
+        Integer ages at which to compute expected income.
+    spec : IncomeModelSpec
+        Income model specification (type, growth rate, education, etc.).
+    profile : InvestorProfile
+        Investor profile, used for current age, retirement_age, and
+        after_tax_income as the base income level.
+
+    Returns
+    -------
+    np.ndarray
+        Expected annual after-tax income in dollars, one entry per age.
+    """
+    working = ages < profile.retirement_age
     base_income = profile.after_tax_income or 0.0
 
     if spec.type == "flat":
-        return base_income
+        incomes = np.full(ages.shape, base_income)
 
-    if spec.type == "growth":
-        years = age - profile.age
-        return base_income * (1.0 + spec.g) ** years
+    elif spec.type == "growth":
+        incomes = base_income * (1.0 + spec.g) ** (ages - profile.age)
 
-    if spec.type == "profile":
+    elif spec.type == "profile":
         coeffs = spec.coefficients
         if coeffs is None:
             education = spec.education or "college"
-            if education not in CGM_COEFFICIENTS:
+            if education not in _CGM_INDEX:
                 raise ValueError(f"Unknown education level: {education}")
-            coeffs = CGM_COEFFICIENTS[education]
-
-        # Scale so that the profile matches the user's stated income at current age
-        log_income_at_current = _cgm_log_income(profile.age, coeffs)
-        log_income_at_age = _cgm_log_income(age, coeffs)
-        ratio = math.exp(log_income_at_age - log_income_at_current)
-        return base_income * ratio
-
-    if spec.type == "csv":
-        if spec.path is None:
-            raise ValueError("CSV income model requires a 'path' to the CSV file")
-        df = pd.read_csv(spec.path)
-        if "age" not in df.columns or "income" not in df.columns:
-            raise ValueError("CSV must have 'age' and 'income' columns")
-        # Look for an exact age match first
-        row = df[df["age"] == age]
-        if len(row) == 0:
-            # No exact match -- fall back to linear interpolation.
-            # Sort by age so interpolation works correctly.
-            df = df.sort_values("age")
-            ages = df["age"].values
-            incomes = df["income"].values
-            # Ages outside the CSV range return 0 (no extrapolation)
-            if age < ages[0] or age > ages[-1]:
-                return 0.0
-            # Build a Series indexed by age, add the target age, and interpolate
-            series = pd.Series(list(incomes), index=list(ages))
-            return float(series.reindex([age]).interpolate().iloc[0])
-        return float(row["income"].iloc[0])
-
-    raise ValueError(f"Unknown income model type: {spec.type}")
+            coeffs = _CGM_TABLE[_CGM_INDEX[education]]
+
+        # Scale so that the profile matches the user's stated income at
+        # current age. Horner's form evaluates the cubic with three fused
+        # multiply-adds instead of separate power ops.
+        log_income_at_current = _cgm_anchor(profile.age, tuple(coeffs))
+        if _income_kernels.HAS_NUMBA and ages.size >= 8:
+            # JIT kernel pays off once the vector is long enough to
+            # amortize its dispatch overhead
+            c0, c1, c2, c3 = coeffs
+            incomes = _income_kernels.cgm_income_vec(
+                np.asarray(ages, dtype=np.float64),
+                c0,
+                c1,
+                c2,
+                c3,
+                base_income,
+                log_income_at_current,
+                float(profile.retirement_age),
+            )
+        else:
+            x = ages / 10.0
+            log_income = coeffs[0] + x * (coeffs[1] + x * (coeffs[2] + x * coeffs[3]))
+            incomes = base_income * np.exp(log_income - log_income_at_current)
+
+    elif spec.type == "csv":
+        incomes = np.array([expected_income(int(a), spec, profile) for a in ages])
+
+    else:
+        raise ValueError(f"Unknown income model type: {spec.type}")
+
+    return np.where(working, incomes, 0.0)
+
+
+# Cache for materialized income tables. Keyed on every input that can
+# change the output, including the CSV mtime; cleared wholesale if it
+# grows past the cap (sweeps reuse a handful of profiles at a time).
+_INCOME_TABLE_CACHE: dict[tuple, np.ndarray] = {}
+_INCOME_TABLE_CACHE_MAX = 128
+
+
+def build_income_table(profile: InvestorProfile, ages: np.ndarray) -> np.ndarray:
+    """Materialize the age -> income vector once per profile and reuse it.
+
+    Sensitivity sweeps over market parameters recompute human capital with
+    an identical income stream; this helper caches the
+    ``expected_income_vec()`` result keyed by the income spec fields, the
+    relevant profile fields, and the age range. The returned array is
+    read-only because it is shared across calls.
+
+    Parameters
+    ----------
+    profile : InvestorProfile
+        Investor profile whose income model and demographics drive the table.
+    ages : np.ndarray
+        Integer ages at which to compute expected income.
+
+    Returns
+    -------
+    np.ndarray
+        Expected annual income in dollars, one entry per age.
+    """
+    spec = profile.income_model
+    mtime = 0.0
+    if spec.type == "csv" and spec.path is not None:
+        mtime = os.path.getmtime(spec.path)
+    key = (
+        spec.type,
+        spec.g,
+        spec.education,
+        tuple(spec.coefficients) if spec.coefficients is not None else None,
+        spec.path,
+        mtime,
+        profile.age,
+        profile.retirement_age,
+        profile.after_tax_income,
+        # Full age content, not just endpoints: non-contiguous age grids
+        # with matching endpoints must not collide
+        np.ascontiguousarray(ages).tobytes(),
+    )
+    table = _INCOME_TABLE_CACHE.get(key)
+    if table is None:
+        if len(_INCOME_TABLE_CACHE) >= _INCOME_TABLE_CACHE_MAX:
+            _INCOME_TABLE_CACHE.clear()
+        table = expected_income_vec(ages, spec, profile)
+        table.flags.writeable = False
+        _INCOME_TABLE_CACHE[key] = table
+    return table
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
+# Gamma for each risk tolerance 1..10, precomputed once at import so the
+# conversion is a bounds check plus an index. Slot 0 is a placeholder.
+_GAMMA_TABLE: tuple[float, ...] = (float("nan"),) + tuple(
+    10.0 * (0.2 ** ((rt - 1) / 9.0)) for rt in range(1, 11)
+)
+
 
 def risk_tolerance_to_gamma(rt: int) -> float:
     """Convert risk tolerance (1-10 scale) to gamma (risk aversion coefficient).
@@ -25,10 +31,10 @@ def risk_tolerance_to_gamma(rt: int) -> float:
     """
     if not (1 <= rt <= 10):
         raise ValueError(f"risk_tolerance must be between 1 and 10, got {rt}")
-    return float(10.0 * (0.2 ** ((rt - 1) / 9.0)))
+    return _GAMMA_TABLE[rt]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IncomeModelSpec:
     """Specification for income projection model.
 
@@ -63,8 +69,22 @@ class IncomeModelSpec:
         if self.type not in valid_types:
             raise ValueError(f"income_model type must be one of {valid_types}, got '{self.type}'")
 
+    def _key(self) -> tuple[str, float, str | None, tuple[float, ...] | None, str | None]:
+        """Hashable tuple of the fields that determine income output.
+
+        Used as a memoization key; narrower than hashing the whole spec
+        because it normalizes ``coefficients`` to a tuple.
+        """
+        return (
+            self.type,
+            self.g,
+            self.education,
+            tuple(self.coefficients) if self.coefficients is not None else None,
+            self.path,
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BenefitModelSpec:
     """Specification for retirement benefit model.
 
@@ -92,7 +112,7 @@ class BenefitModelSpec:
             raise ValueError(f"benefit_model type must be one of {valid_types}, got '{self.type}'")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MortalitySpec:
     """Specification for mortality/survival model.
 
@@ -126,7 +146,7 @@ class MortalitySpec:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HumanCapitalSpec:
     """Specification for human capital risk characteristics.
 
@@ -154,7 +174,7 @@ class HumanCapitalSpec:
             raise ValueError(f"human_capital beta must be in [0, 1], got {self.beta}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiscountCurveSpec:
     """Specification for discount curve used to discount future cash flows.
 
@@ -179,7 +199,7 @@ class DiscountCurveSpec:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConstraintsSpec:
     """Allocation constraints controlling the allowed range of equity exposure.
 
@@ -208,7 +228,7 @@ class ConstraintsSpec:
             raise ValueError(f"max_leverage must be >= 1.0, got {self.max_leverage}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketAssumptions:
     """Capital market assumptions for the stock/bond asset universe.
 
@@ -242,7 +262,7 @@ class MarketAssumptions:
             raise ValueError(f"borrowing_spread must be >= 0, got {self.borrowing_spread}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InvestorProfile:
     """Complete investor profile combining demographics, income, and preferences.
 
@@ -307,7 +327,63 @@ class InvestorProfile:
         return risk_tolerance_to_gamma(self.risk_tolerance)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class AllocationComponents:
+    """Intermediate values from an allocation computation.
+
+    A fixed-schema record passed to the explanation builder and exposed to
+    users via ``AllocationResult.components``. Frozen with slots so that
+    repeated allocation calls allocate one compact object instead of a dict.
+
+    Attributes
+    ----------
+    human_capital : float
+        Present value of future earnings and benefits (H).
+    human_capital_beta : float
+        Equity-like fraction of human capital.
+    human_capital_bond_like : float
+        Bond-like portion of H: ``(1 - beta) * H``.
+    human_capital_equity_like : float
+        Equity-like portion of H: ``beta * H``.
+    investable_wealth : float
+        Current financial wealth (W).
+    hw_ratio : float
+        Human capital to financial wealth ratio (H/W).
+    gamma : float
+        Resolved risk aversion coefficient.
+    alpha_star : float
+        Baseline risky share before human capital adjustment.
+    alpha_unconstrained : float
+        Allocation after human capital adjustment, before clamping.
+    alpha_recommended : float
+        Final clamped allocation.
+    leverage_applied : bool
+        True if the final allocation uses leverage.
+    borrowing_cost_drag : float
+        Reduction in alpha_star caused by the borrowing spread.
+    mu, r, sigma, borrowing_spread : float
+        Market assumptions used for the computation.
+    """
+
+    human_capital: float
+    human_capital_beta: float
+    human_capital_bond_like: float
+    human_capital_equity_like: float
+    investable_wealth: float
+    hw_ratio: float
+    gamma: float
+    alpha_star: float
+    alpha_unconstrained: float
+    alpha_recommended: float
+    leverage_applied: bool
+    borrowing_cost_drag: float
+    mu: float
+    r: float
+    sigma: float
+    borrowing_spread: float
+
+
+@dataclass(frozen=True, slots=True)
 class AllocationResult:
     """Result of an allocation computation.
 
@@ -330,10 +406,11 @@ class AllocationResult:
         Reduction in alpha_star caused by the borrowing spread.
     explain : str
         Human-readable explanation of the allocation result.
-    components : dict
+    components_struct : AllocationComponents
         Intermediate values for debugging and education (H, W, H/W, gamma,
         market assumptions, ``human_capital_beta``, ``human_capital_bond_like``,
-        ``human_capital_equity_like``, etc.).
+        ``human_capital_equity_like``, etc.). Use the ``components`` property
+        for a plain dict view.
     """
 
     alpha_star: float
@@ -343,4 +420,9 @@ class AllocationResult:
     leverage_applied: bool
     borrowing_cost_drag: float
     explain: str
-    components: dict[str, Any]
+    components_struct: AllocationComponents
+
+    @property
+    def components(self) -> dict[str, Any]:
+        """Intermediate values as a plain dict (JSON export and back-compat)."""
+        return asdict(self.components_struct)
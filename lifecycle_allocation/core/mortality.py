@@ -2,18 +2,55 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
+
 from lifecycle_allocation.core.models import MortalitySpec
 
 
+@lru_cache(maxsize=64)
+def _survival_vector(
+    from_age: int, max_age: int, model_key: tuple[str, float, float, str | None]
+) -> np.ndarray:
+    """Precompute S(from_age -> age) for age = from_age+1..max_age.
+
+    The survival curve is fixed per (from_age, horizon, model), so build it
+    once and share it across allocation calls. ``model_key`` is the
+    hashable (type, mode, dispersion, path) tuple from ``MortalitySpec``.
+    The returned array is marked read-only because it is cached.
+    """
+    model_type = model_key[0]
+    if model_type == "none":
+        probs = np.ones(max_age - from_age)
+    else:
+        raise ValueError(f"Unknown mortality model type: {model_type}")
+    probs.flags.writeable = False
+    return probs
+
+
 def survival_prob(from_age: int, to_age: int, spec: MortalitySpec) -> float:
     """Compute survival probability S(from_age -> to_age).
 
-    Returns a value in [0, 1].
+    Returns a value in [0, 1]. Delegates to ``survival_prob_vec()`` so the
+    scalar and vectorized paths share one implementation.
     """
     if to_age <= from_age:
         return 1.0
 
-    if spec.type == "none":
-        return 1.0
+    return float(survival_prob_vec(from_age, np.asarray([to_age]), spec)[0])
+
 
-    raise ValueError(f"Unknown mortality model type: {spec.type}")
+def survival_prob_vec(from_age: int, to_ages: np.ndarray, spec: MortalitySpec) -> np.ndarray:
+    """Compute survival probabilities S(from_age -> to_age) for an array of ages.
+
+    Vectorized counterpart of ``survival_prob()``. Returns values in [0, 1],
+    one entry per target age. The full survival curve is cached per
+    (from_age, horizon, model), so repeated allocation calls for the same
+    investor reuse one precomputed table.
+    """
+    if to_ages.size == 0:
+        return np.empty(0)
+    model_key = (spec.type, spec.mode, spec.dispersion, spec.path)
+    probs = _survival_vector(from_age, int(to_ages.max()), model_key)
+    return probs[to_ages - from_age - 1]
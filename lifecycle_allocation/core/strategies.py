@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 from lifecycle_allocation.core.allocation import recommended_stock_share
@@ -18,29 +21,57 @@ def strategy_sixty_forty(age: int) -> float:
     return 0.60
 
 
+def strategy_sixty_forty_vec(ages: np.ndarray) -> np.ndarray:
+    """Vectorized counterpart of ``strategy_sixty_forty()`` for age arrays."""
+    return np.full(ages.shape, 0.60, dtype=np.float64)
+
+
 def strategy_n_minus_age(age: int, n: int = 100) -> float:
     """N-minus-age rule: (N - age)/100, clamped to [0, 1]."""
     return max(0.0, min((n - age) / 100.0, 1.0))
 
 
+def strategy_n_minus_age_vec(ages: np.ndarray, n: int = 100) -> np.ndarray:
+    """Vectorized counterpart of ``strategy_n_minus_age()`` for age arrays."""
+    return np.clip((n - ages) / 100.0, 0.0, 1.0)
+
+
+_TDF_MAX_AGE = 120
+
+
+@lru_cache(maxsize=32)
+def _tdf_curve(retirement_age: int) -> np.ndarray:
+    """Precompute the full age-indexed TDF glide path for a retirement age.
+
+    The piecewise-linear glide is fixed per retirement age, so build the
+    whole curve once with np.interp and look ages up by index. The array
+    is marked read-only because it is cached.
+    """
+    # The retirement knot must stay strictly between the 22 and 90 knots,
+    # otherwise the xp sequence is non-increasing and np.interp output is
+    # undefined. Out-of-band retirement ages saturate at the neighbors.
+    knot = min(max(retirement_age, 23), 89)
+    curve = np.interp(
+        np.arange(_TDF_MAX_AGE + 1),
+        [0, 22, knot, 90, _TDF_MAX_AGE],
+        [0.90, 0.90, 0.50, 0.30, 0.30],
+    )
+    curve.flags.writeable = False
+    return curve
+
+
 def strategy_parametric_tdf(age: int, retirement_age: int = 67) -> float:
     """Parametric target-date fund glide path.
 
     Linear glide from 90% at age 22 to 50% at retirement to 30% at age 90+.
+    Implemented as a lookup into the cached per-retirement-age curve.
     """
-    if age <= 22:
-        return 0.90
-    if age >= 90:
-        return 0.30
+    return float(_tdf_curve(retirement_age)[min(max(age, 0), _TDF_MAX_AGE)])
+
 
-    if age <= retirement_age:
-        # Linear from 90% at 22 to 50% at retirement_age
-        fraction = (age - 22) / (retirement_age - 22)
-        return 0.90 - fraction * (0.90 - 0.50)
-    else:
-        # Linear from 50% at retirement_age to 30% at 90
-        fraction = (age - retirement_age) / (90 - retirement_age)
-        return 0.50 - fraction * (0.50 - 0.30)
+def strategy_parametric_tdf_vec(ages: np.ndarray, retirement_age: int = 67) -> np.ndarray:
+    """Vectorized counterpart of ``strategy_parametric_tdf()`` for age arrays."""
+    return _tdf_curve(retirement_age)[np.clip(ages, 0, _TDF_MAX_AGE)]
 
 
 def compare_strategies(
@@ -55,34 +86,45 @@ def compare_strategies(
 
     Returns a DataFrame with columns: strategy, allocation, description.
     """
+    # The lifecycle allocation (human_capital_pv + alpha_star) is computed
+    # exactly once here; the heuristic strategies are cheap scalar rules.
     result = recommended_stock_share(profile, market, curve, constraints)
     age = profile.age
 
-    rows: list[dict[str, object]] = [
-        {
-            "strategy": "Choi Lifecycle",
-            "allocation": result.alpha_recommended,
-            "description": "Human-capital-adjusted Merton rule",
-        },
-        {
-            "strategy": "60/40",
-            "allocation": strategy_sixty_forty(age),
-            "description": "Classic fixed 60% equity / 40% bonds",
-        },
-        {
-            "strategy": "100-minus-age",
-            "allocation": strategy_n_minus_age(age, 100),
-            "description": f"Equity = (100 - {age}) / 100",
-        },
-        {
-            "strategy": "Target-Date Fund",
-            "allocation": strategy_parametric_tdf(age, profile.retirement_age),
-            "description": "Parametric TDF glide path",
-        },
+    # Preallocate the columns at their final length so user-supplied
+    # strategies are assigned by index instead of grown with append.
+    n = 4 + (len(strategies) if strategies else 0)
+    names: list[str | None] = [None] * n
+    allocations: list[float] = [0.0] * n
+    descriptions: list[str | None] = [None] * n
+
+    names[:4] = ["Choi Lifecycle", "60/40", "100-minus-age", "Target-Date Fund"]
+    allocations[:4] = [
+        result.alpha_recommended,
+        strategy_sixty_forty(age),
+        strategy_n_minus_age(age, 100),
+        strategy_parametric_tdf(age, profile.retirement_age),
+    ]
+    descriptions[:4] = [
+        "Human-capital-adjusted Merton rule",
+        "Classic fixed 60% equity / 40% bonds",
+        f"Equity = (100 - {age}) / 100",
+        "Parametric TDF glide path",
     ]
 
     if strategies:
-        for name, alloc in strategies.items():
-            rows.append({"strategy": name, "allocation": alloc, "description": "User-supplied"})
-
-    return pd.DataFrame(rows)
+        for i, (name, alloc) in enumerate(strategies.items(), start=4):
+            names[i] = name
+            allocations[i] = alloc
+            descriptions[i] = "User-supplied"
+
+    # Column-wise construction avoids the per-row dict materialization of
+    # the list-of-records form; typing the allocation column up front
+    # skips pandas dtype inference.
+    return pd.DataFrame(
+        {
+            "strategy": names,
+            "allocation": np.asarray(allocations, dtype=np.float64),
+            "description": descriptions,
+        }
+    )
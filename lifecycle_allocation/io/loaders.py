@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 import yaml
 
+try:
+    # libyaml-backed parser, substantially faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - exercised only without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from lifecycle_allocation.core.human_capital import suggested_beta
 from lifecycle_allocation.core.models import (
     BenefitModelSpec,
@@ -18,6 +25,21 @@ from lifecycle_allocation.core.models import (
     MortalitySpec,
 )
 
+# Bind the loader choice once so each load_profile call is a direct call
+# instead of a module attribute lookup plus keyword dispatch
+_yaml_load = functools.partial(yaml.load, Loader=_YamlLoader)
+
+# Shared default instances for sections that are absent or empty in the
+# YAML. The specs are frozen, so reusing one object per section skips
+# dataclass construction and __post_init__ validation on minimal profiles.
+_DEFAULT_INCOME = IncomeModelSpec()
+_DEFAULT_BENEFIT = BenefitModelSpec()
+_DEFAULT_MORTALITY = MortalitySpec()
+_DEFAULT_HUMAN_CAPITAL = HumanCapitalSpec()
+_DEFAULT_MARKET = MarketAssumptions()
+_DEFAULT_CURVE = DiscountCurveSpec()
+_DEFAULT_CONSTRAINTS = ConstraintsSpec()
+
 
 def load_profile(
     path: str | Path,
@@ -46,8 +68,9 @@ def load_profile(
         If the specified path does not exist.
     """
     path = Path(path)
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    # Bulk-read the file so the parser sees one string instead of issuing
+    # many small reads against the file object
+    data = _yaml_load(path.read_text())
 
     if not isinstance(data, dict):
         raise ValueError(f"Expected a YAML mapping, got {type(data).__name__}")
@@ -57,39 +80,51 @@ def load_profile(
     # profile -> market -> discount curve -> constraints.
 
     # Income model
-    income_data = data.get("income_model", {})
-    income_model = IncomeModelSpec(
-        type=income_data.get("type", "flat"),
-        g=income_data.get("g", 0.0),
-        education=income_data.get("education"),
-        coefficients=income_data.get("coefficients"),
-        path=income_data.get("path"),
-    )
+    income_data = data.get("income_model")
+    if not income_data:
+        income_model = _DEFAULT_INCOME
+    else:
+        income_model = IncomeModelSpec(
+            type=income_data.get("type", "flat"),
+            g=income_data.get("g", 0.0),
+            education=income_data.get("education"),
+            coefficients=income_data.get("coefficients"),
+            path=income_data.get("path"),
+        )
 
     # Benefit model
-    benefit_data = data.get("benefit_model", {})
-    benefit_model = BenefitModelSpec(
-        type=benefit_data.get("type", "none"),
-        annual_benefit=benefit_data.get("annual_benefit", 0.0),
-        replacement_rate=benefit_data.get("replacement_rate", 0.0),
-    )
+    benefit_data = data.get("benefit_model")
+    if not benefit_data:
+        benefit_model = _DEFAULT_BENEFIT
+    else:
+        benefit_model = BenefitModelSpec(
+            type=benefit_data.get("type", "none"),
+            annual_benefit=benefit_data.get("annual_benefit", 0.0),
+            replacement_rate=benefit_data.get("replacement_rate", 0.0),
+        )
 
     # Mortality model
-    mortality_data = data.get("mortality_model", {})
-    mortality_model = MortalitySpec(
-        type=mortality_data.get("type", "none"),
-    )
+    mortality_data = data.get("mortality_model")
+    if not mortality_data:
+        mortality_model = _DEFAULT_MORTALITY
+    else:
+        mortality_model = MortalitySpec(
+            type=mortality_data.get("type", "none"),
+        )
 
     # Human capital model
-    hc_data = data.get("human_capital_model", {})
-    hc_beta = hc_data.get("beta")
-    hc_industry = hc_data.get("industry")
-    if hc_beta is None and hc_industry is not None:
-        hc_beta = suggested_beta(hc_industry)
-    human_capital_model = HumanCapitalSpec(
-        beta=hc_beta if hc_beta is not None else 0.0,
-        industry=hc_industry,
-    )
+    hc_data = data.get("human_capital_model")
+    if not hc_data:
+        human_capital_model = _DEFAULT_HUMAN_CAPITAL
+    else:
+        hc_beta = hc_data.get("beta")
+        hc_industry = hc_data.get("industry")
+        if hc_beta is None and hc_industry is not None:
+            hc_beta = suggested_beta(hc_industry)
+        human_capital_model = HumanCapitalSpec(
+            beta=hc_beta if hc_beta is not None else 0.0,
+            industry=hc_industry,
+        )
 
     # Profile
     profile = InvestorProfile(
@@ -106,29 +141,38 @@ def load_profile(
     )
 
     # Market assumptions
-    market_data = data.get("market", {})
-    market = MarketAssumptions(
-        mu=market_data.get("mu", 0.05),
-        r=market_data.get("r", 0.02),
-        sigma=market_data.get("sigma", 0.18),
-        real=market_data.get("real", True),
-        borrowing_spread=market_data.get("borrowing_spread", 0.0),
-    )
+    market_data = data.get("market")
+    if not market_data:
+        market = _DEFAULT_MARKET
+    else:
+        market = MarketAssumptions(
+            mu=market_data.get("mu", 0.05),
+            r=market_data.get("r", 0.02),
+            sigma=market_data.get("sigma", 0.18),
+            real=market_data.get("real", True),
+            borrowing_spread=market_data.get("borrowing_spread", 0.0),
+        )
 
     # Discount curve
-    curve_data = data.get("discount_curve", {})
-    curve = DiscountCurveSpec(
-        type=curve_data.get("type", "constant"),
-        rate=curve_data.get("rate", 0.02),
-    )
+    curve_data = data.get("discount_curve")
+    if not curve_data:
+        curve = _DEFAULT_CURVE
+    else:
+        curve = DiscountCurveSpec(
+            type=curve_data.get("type", "constant"),
+            rate=curve_data.get("rate", 0.02),
+        )
 
     # Constraints
-    constraints_data = data.get("constraints", {})
-    constraints = ConstraintsSpec(
-        allow_leverage=constraints_data.get("allow_leverage", False),
-        max_leverage=constraints_data.get("max_leverage", 1.0),
-        allow_short=constraints_data.get("allow_short", False),
-        min_allocation=constraints_data.get("min_allocation", 0.0),
-    )
+    constraints_data = data.get("constraints")
+    if not constraints_data:
+        constraints = _DEFAULT_CONSTRAINTS
+    else:
+        constraints = ConstraintsSpec(
+            allow_leverage=constraints_data.get("allow_leverage", False),
+            max_leverage=constraints_data.get("max_leverage", 1.0),
+            allow_short=constraints_data.get("allow_short", False),
+            min_allocation=constraints_data.get("min_allocation", 0.0),
+        )
 
     return profile, market, curve, constraints
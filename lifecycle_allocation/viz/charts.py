@@ -2,36 +2,156 @@
 
 from __future__ import annotations
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import numpy as np
 
-def _is_notebook() -> bool:
-    try:
-        from IPython import get_ipython  # type: ignore[import-not-found]
+from lifecycle_allocation.core.allocation import recommended_stock_share
+from lifecycle_allocation.core.models import (
+    AllocationResult,
+    HumanCapitalSpec,
+    InvestorProfile,
+    MarketAssumptions,
+)
+from lifecycle_allocation.viz.themes import STYLE_PATH, THEME
 
-        return get_ipython() is not None
-    except ImportError:
-        return False
+if TYPE_CHECKING:  # pragma: no cover - import-time types only
+    from collections.abc import Sequence
 
+    import pandas as pd
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
-import matplotlib  # noqa: E402
 
-if not _is_notebook():
-    matplotlib.use("Agg")
+@lru_cache(maxsize=1)
+def _pyplot():  # noqa: ANN202 - return type requires the lazy import
+    """Import, configure, and cache matplotlib.pyplot on first use.
 
-import matplotlib.pyplot as plt  # noqa: E402
-import pandas as pd  # noqa: E402
-from matplotlib.axes import Axes  # noqa: E402
-from matplotlib.figure import Figure  # noqa: E402
+    matplotlib costs several hundred milliseconds to import, so chart
+    functions defer it until a plot is actually drawn; CLI runs without
+    --report never pay for it. When pyplot is not yet imported, the
+    headless Agg backend is selected by default, overridable via the
+    LIFECYCLE_MPL_BACKEND environment variable. When the host process
+    has already imported pyplot (a notebook with an inline backend, for
+    example), its backend is left untouched: switching backends here
+    would silently break the host's own rendering.
+    """
+    import matplotlib
+
+    if "matplotlib.pyplot" not in sys.modules:
+        matplotlib.use(os.environ.get("LIFECYCLE_MPL_BACKEND", "Agg"))
+    import matplotlib.pyplot as plt
+
+    # rcParams-level theme (hidden spines, tick sizes) applies to every
+    # axes from creation, replacing per-chart spine mutation
+    plt.style.use(str(STYLE_PATH))
+    return plt
+
+
+# Fixed strategy-name to color assignment, resolved once from THEME
+_STRATEGY_COLOR_MAP: dict[str, str] = {
+    "Choi Lifecycle": THEME["colors"]["choi"],
+    "60/40": THEME["colors"]["sixty_forty"],
+    "100-minus-age": THEME["colors"]["n_minus_age"],
+    "Target-Date Fund": THEME["colors"]["tdf"],
+}
 
-from lifecycle_allocation.core.allocation import recommended_stock_share  # noqa: E402
-from lifecycle_allocation.core.models import (  # noqa: E402
-    AllocationResult,
-    HumanCapitalSpec,
-    InvestorProfile,
-    MarketAssumptions,
-)
-from lifecycle_allocation.viz.themes import THEME, apply_theme  # noqa: E402
+
+@lru_cache(maxsize=1)
+def _pct_formatter():  # noqa: ANN202 - return type requires the lazy import
+    """Build the shared percent tick formatter once.
+
+    The formatter is stateless, so one instance serves every chart
+    instead of allocating a new closure per call.
+    """
+    return _pyplot().FuncFormatter(lambda x, _: f"{x:.0%}")
+
+
+@lru_cache(maxsize=4)
+def _get_scratch_axes(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Build and cache one (Figure, Axes) scratch pair per figsize.
+
+    Axes construction (spines, scales, ticks) dominates plt.subplots cost,
+    so when the caller does not supply an axes we reuse a cached pair and
+    clear it instead of creating a fresh one per chart.
+    """
+    return _pyplot().subplots(figsize=figsize)
+
+
+def _fresh_axes(ax: Axes | None) -> tuple[Figure, Axes]:
+    """Resolve the target (Figure, Axes) for a chart call.
+
+    A caller-supplied axes is used as-is; otherwise the cached scratch
+    pair is cleared and returned.
+    """
+    if ax is not None:
+        fig = ax.get_figure()
+        assert fig is not None
+        return fig, ax
+    fig, ax = _get_scratch_axes(tuple(THEME["figsize"]))
+    ax.clear()
+    return fig, ax
+
+
+class ChartRenderer:
+    """Context manager that reuses one figure across several chart saves.
+
+    Figure and Axes construction dominate matplotlib overhead when
+    rendering a handful of charts back to back (the CLI report path
+    saves two). Open one renderer, draw each chart onto ``renderer.ax``,
+    and call ``save()`` between charts; the axes is cleared for the next
+    draw while the figure survives.
+
+    Examples
+    --------
+    >>> with ChartRenderer() as r:  # doctest: +SKIP
+    ...     plot_balance_sheet(result, profile, ax=r.ax)
+    ...     r.save("balance_sheet.png")
+    ...     plot_strategy_bars(df, ax=r.ax)
+    ...     r.save("strategy_bars.png")
+    """
+
+    def __enter__(self) -> ChartRenderer:
+        self.fig, self.ax = _pyplot().subplots(figsize=THEME["figsize"])
+        return self
+
+    def save(self, save_path: str | Path) -> None:
+        """Save the current figure, then clear the axes for the next chart."""
+        self.fig.tight_layout()
+        _savefig(self.fig, save_path)
+        self.ax.clear()
+
+    def __exit__(self, *exc_info: object) -> None:
+        _pyplot().close(self.fig)
+
+
+# Raster resolution for saved charts. Overridable via environment so
+# callers that never inspect pixels (smoke tests, previews) can trade
+# resolution for encoder and memory-bandwidth time.
+_SAVE_DPI = float(os.environ.get("LIFECYCLE_SAVE_DPI", "150"))
+
+
+def _savefig(fig: Figure, save_path: str | Path) -> None:
+    """Save a figure without the tight-bbox double render.
+
+    The charts already run fig.tight_layout(), so bbox_inches="tight"
+    (which renders the figure twice to measure it) is redundant. PNG
+    saves use a light Deflate level with optimization off, since these
+    small report charts are not worth extra encoder CPU; SVG output
+    skips the timestamp and creator string so repeated saves are
+    byte-identical.
+    """
+    path = str(save_path)
+    if path.endswith(".svg"):
+        fig.savefig(path, dpi=_SAVE_DPI, metadata={"Date": None, "Creator": None})
+    elif path.endswith(".png"):
+        fig.savefig(path, dpi=_SAVE_DPI, pil_kwargs={"compress_level": 1, "optimize": False})
+    else:
+        fig.savefig(path, dpi=_SAVE_DPI)
 
 
 def plot_balance_sheet(
@@ -40,6 +160,7 @@ def plot_balance_sheet(
     *,
     ax: Axes | None = None,
     save_path: str | Path | None = None,
+    rasterize_bars: bool = True,
 ) -> Figure:
     """Plot the personal balance sheet: W, H, and W+H.
 
@@ -53,27 +174,37 @@ def plot_balance_sheet(
     profile : InvestorProfile
         Investor profile containing investable_wealth.
     ax : Axes or None
-        Matplotlib axes to draw on. If None, a new figure is created.
+        Matplotlib axes to draw on. If None, a shared scratch figure is
+        cleared and reused; the next no-``ax`` chart call will clear it
+        again, so save or copy the result before drawing another chart.
+        Pass your own axes to keep multiple figures alive at once.
     save_path : str, Path, or None
         If provided, saves the figure to this path at 150 DPI.
+    rasterize_bars : bool
+        If True (default), the bar patches are rasterized at save time
+        while axes, labels, and annotations stay vector. This keeps SVG
+        output small and text crisp in both formats.
 
     Returns
     -------
     Figure
         The matplotlib Figure containing the chart.
     """
+    # Hoist theme lookups into locals once; the nested subscripts were
+    # re-hashed at every use on the hot path
     colors = THEME["colors"]
+    font_size = THEME["font_size"]
+    fs_annotation = font_size["annotation"]
+    fs_title = font_size["title"]
+    fs_label = font_size["label"]
     w = profile.investable_wealth
     h = result.human_capital
     total = w + h
     hw_ratio = h / w if w > 0 else 0.0
     beta_h = result.components.get("human_capital_beta", 0.0)
 
-    if ax is None:
-        fig, ax = plt.subplots(figsize=THEME["figsize"])
-    else:
-        fig = ax.get_figure()  # type: ignore[assignment]
-    assert ax is not None and fig is not None
+    own_axes = ax is None
+    fig, ax = _fresh_axes(ax)
 
     if beta_h > 0:
         # Show H decomposed into bond-like and equity-like portions
@@ -89,49 +220,61 @@ def plot_balance_sheet(
         bar_colors = [colors["wealth"], colors["human_capital"], colors["total"]]
 
     bars = ax.bar(labels, values, color=bar_colors, width=THEME["bar_width"])
-
-    # Annotate values
-    for bar, val in zip(bars, values):
-        ax.text(
-            bar.get_x() + bar.get_width() / 2,
-            bar.get_height(),
-            f"${val:,.0f}",
-            ha="center",
-            va="bottom",
-            fontsize=THEME["font_size"]["annotation"],
-            fontweight="bold",
-        )
+    if rasterize_bars:
+        for bar in bars:
+            bar.set_rasterized(True)
+
+    # Annotate values in one pass; bar_label positions every label from
+    # the container instead of creating Text artists one at a time
+    ax.bar_label(
+        bars,
+        labels=[f"${val:,.0f}" for val in values],
+        padding=3,
+        fontsize=fs_annotation,
+        fontweight="bold",
+    )
 
     title = f"Personal Balance Sheet (H/W = {hw_ratio:.1f}x)"
     if beta_h > 0:
         title += f", beta={beta_h:.2f}"
-    ax.set_title(title, fontsize=THEME["font_size"]["title"], fontweight="bold")
-    ax.set_ylabel("Value ($)", fontsize=THEME["font_size"]["label"])
-    apply_theme(ax)
+    ax.set_title(title, fontsize=fs_title, fontweight="bold")
+    ax.set_ylabel("Value ($)", fontsize=fs_label)
 
-    fig.tight_layout()
+    if own_axes:
+        # When the caller supplies the axes they own layout; skip the
+        # extra measuring render. pad bounds the adjustment iterations.
+        fig.tight_layout(pad=0.3)
 
     if save_path:
-        fig.savefig(str(save_path), dpi=150, bbox_inches="tight")
+        _savefig(fig, save_path)
 
     return fig
 
 
-def plot_strategy_bars(
-    comparison_df: pd.DataFrame,
+def plot_strategy_bars_arrays(
+    strategies: Sequence[str],
+    allocations: Sequence[float],
     *,
     ax: Axes | None = None,
     save_path: str | Path | None = None,
 ) -> Figure:
     """Plot horizontal bar chart comparing allocation strategies.
 
+    Array-based core of ``plot_strategy_bars()``; takes the strategy
+    names and allocations directly, so callers that already hold plain
+    sequences skip the DataFrame round trip entirely.
+
     Parameters
     ----------
-    comparison_df : pd.DataFrame
-        DataFrame from ``compare_strategies()`` with columns ``strategy``
-        and ``allocation``.
+    strategies : sequence of str
+        Strategy names, one per bar.
+    allocations : sequence of float
+        Stock allocation per strategy, same length as ``strategies``.
     ax : Axes or None
-        Matplotlib axes to draw on. If None, a new figure is created.
+        Matplotlib axes to draw on. If None, a shared scratch figure is
+        cleared and reused; the next no-``ax`` chart call will clear it
+        again, so save or copy the result before drawing another chart.
+        Pass your own axes to keep multiple figures alive at once.
     save_path : str, Path, or None
         If provided, saves the figure to this path at 150 DPI.
 
@@ -140,59 +283,90 @@ def plot_strategy_bars(
     Figure
         The matplotlib Figure containing the chart.
     """
-    colors = THEME["colors"]
-    color_map = {
-        "Choi Lifecycle": colors["choi"],
-        "60/40": colors["sixty_forty"],
-        "100-minus-age": colors["n_minus_age"],
-        "Target-Date Fund": colors["tdf"],
-    }
-
-    if ax is None:
-        fig, ax = plt.subplots(figsize=THEME["figsize"])
-    else:
-        fig = ax.get_figure()  # type: ignore[assignment]
-    assert ax is not None and fig is not None
+    # Hoist theme lookups into locals once per call
+    user_color = THEME["colors"]["user"]
+    font_size = THEME["font_size"]
 
-    strategies = comparison_df["strategy"].tolist()
-    allocations = comparison_df["allocation"].tolist()
-    bar_colors = [color_map.get(s, colors["user"]) for s in strategies]
+    own_axes = ax is None
+    fig, ax = _fresh_axes(ax)
 
-    y_pos = range(len(strategies))
-    ax.barh(y_pos, allocations, color=bar_colors, height=0.5)
+    bar_colors = [_STRATEGY_COLOR_MAP.get(s, user_color) for s in strategies]
 
-    ax.set_yticks(list(y_pos))
+    # Typed arrays take matplotlib's fast input-conversion path and are
+    # reused for the bars, the axis limit, and the labels
+    alloc_arr = np.asarray(allocations, dtype=np.float64)
+    y_pos = np.arange(len(strategies))
+    container = ax.barh(y_pos, alloc_arr, color=bar_colors, height=0.5)
+
+    ax.set_yticks(y_pos)
     ax.set_yticklabels(strategies)
-    ax.set_xlabel("Stock Allocation (%)", fontsize=THEME["font_size"]["label"])
+    ax.set_xlabel("Stock Allocation (%)", fontsize=font_size["label"])
     ax.set_title(
         "Strategy Comparison",
-        fontsize=THEME["font_size"]["title"],
+        fontsize=font_size["title"],
         fontweight="bold",
     )
 
-    # Annotate percentages
-    for i, alloc in enumerate(allocations):
-        ax.text(
-            alloc + 0.01,
-            i,
-            f"{alloc:.0%}",
-            va="center",
-            fontsize=THEME["font_size"]["annotation"],
-        )
+    # Annotate percentages in one bar_label pass
+    ax.bar_label(
+        container,
+        labels=[f"{alloc:.0%}" for alloc in alloc_arr],
+        padding=3,
+        fontsize=font_size["annotation"],
+    )
 
     # Format x-axis as percentage
-    ax.set_xlim(0, max(allocations) * 1.2 + 0.05)
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f"{x:.0%}"))
+    ax.set_xlim(0, float(alloc_arr.max()) * 1.2 + 0.05)
+    ax.xaxis.set_major_formatter(_pct_formatter())
 
-    apply_theme(ax)
-    fig.tight_layout()
+    if own_axes:
+        # When the caller supplies the axes they own layout; skip the
+        # extra measuring render. pad bounds the adjustment iterations.
+        fig.tight_layout(pad=0.3)
 
     if save_path:
-        fig.savefig(str(save_path), dpi=150, bbox_inches="tight")
+        _savefig(fig, save_path)
 
     return fig
 
 
+def plot_strategy_bars(
+    comparison_df: pd.DataFrame,
+    *,
+    ax: Axes | None = None,
+    save_path: str | Path | None = None,
+) -> Figure:
+    """Plot horizontal bar chart comparing allocation strategies.
+
+    DataFrame adapter over ``plot_strategy_bars_arrays()``; extracts the
+    two columns once and hands plain arrays to the drawing code.
+
+    Parameters
+    ----------
+    comparison_df : pd.DataFrame
+        DataFrame from ``compare_strategies()`` with columns ``strategy``
+        and ``allocation``.
+    ax : Axes or None
+        Matplotlib axes to draw on. If None, a shared scratch figure is
+        cleared and reused; the next no-``ax`` chart call will clear it
+        again, so save or copy the result before drawing another chart.
+        Pass your own axes to keep multiple figures alive at once.
+    save_path : str, Path, or None
+        If provided, saves the figure to this path at 150 DPI.
+
+    Returns
+    -------
+    Figure
+        The matplotlib Figure containing the chart.
+    """
+    return plot_strategy_bars_arrays(
+        comparison_df["strategy"].to_numpy(),
+        comparison_df["allocation"].to_numpy(),
+        ax=ax,
+        save_path=save_path,
+    )
+
+
 def plot_beta_sensitivity(
     profile: InvestorProfile,
     market: MarketAssumptions,
@@ -216,7 +390,10 @@ def plot_beta_sensitivity(
     betas : list of float or None
         Beta values to evaluate. Defaults to 0.0, 0.1, ..., 1.0.
     ax : Axes or None
-        Matplotlib axes to draw on. If None, a new figure is created.
+        Matplotlib axes to draw on. If None, a shared scratch figure is
+        cleared and reused; the next no-``ax`` chart call will clear it
+        again, so save or copy the result before drawing another chart.
+        Pass your own axes to keep multiple figures alive at once.
     save_path : str, Path, or None
         If provided, saves the figure to this path at 150 DPI.
 
@@ -225,38 +402,37 @@ def plot_beta_sensitivity(
     Figure
         The matplotlib Figure containing the chart.
     """
-    import copy
+    import dataclasses
 
     if betas is None:
         betas = [i / 10.0 for i in range(11)]
 
     allocations = []
     for b in betas:
-        p = copy.copy(profile)
-        p.human_capital_model = HumanCapitalSpec(beta=b)
+        p = dataclasses.replace(profile, human_capital_model=HumanCapitalSpec(beta=b))
         r = recommended_stock_share(p, market)
         allocations.append(r.alpha_recommended)
 
-    if ax is None:
-        fig, ax = plt.subplots(figsize=THEME["figsize"])
-    else:
-        fig = ax.get_figure()  # type: ignore[assignment]
-    assert ax is not None and fig is not None
+    own_axes = ax is None
+    fig, ax = _fresh_axes(ax)
 
+    font_size = THEME["font_size"]
     ax.plot(betas, allocations, linewidth=2.5, color=THEME["colors"]["choi"], marker="o")
-    ax.set_xlabel("Human Capital Beta", fontsize=THEME["font_size"]["label"])
-    ax.set_ylabel("Recommended Stock Allocation", fontsize=THEME["font_size"]["label"])
+    ax.set_xlabel("Human Capital Beta", fontsize=font_size["label"])
+    ax.set_ylabel("Recommended Stock Allocation", fontsize=font_size["label"])
     ax.set_title(
         "Allocation Sensitivity to Human Capital Beta",
-        fontsize=THEME["font_size"]["title"],
+        fontsize=font_size["title"],
         fontweight="bold",
     )
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f"{x:.0%}"))
+    ax.yaxis.set_major_formatter(_pct_formatter())
     ax.set_xlim(0, 1)
-    apply_theme(ax)
-    fig.tight_layout()
+    if own_axes:
+        # When the caller supplies the axes they own layout; skip the
+        # extra measuring render. pad bounds the adjustment iterations.
+        fig.tight_layout(pad=0.3)
 
     if save_path:
-        fig.savefig(str(save_path), dpi=150, bbox_inches="tight")
+        _savefig(fig, save_path)
 
     return fig
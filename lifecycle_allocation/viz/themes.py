@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from matplotlib.axes import Axes
+if TYPE_CHECKING:  # pragma: no cover - import-time types only
+    from matplotlib.axes import Axes
+
+# Style sheet holding the rcParams side of the theme (hidden spines,
+# tick and label sizes). Activated once when pyplot is first imported;
+# see charts._pyplot().
+STYLE_PATH = Path(__file__).parent / "_style.mplstyle"
 
 # Visual theme configuration for all lifecycle-allocation charts.
 # - "colors": named color palette for chart elements (bars, lines, fills)
@@ -35,7 +42,14 @@ THEME: dict[str, Any] = {
 
 
 def apply_theme(ax: Axes) -> None:
-    """Apply consistent styling to a matplotlib axes."""
+    """Apply consistent styling to a matplotlib axes.
+
+    Axes created while the ``STYLE_PATH`` style sheet is active (any axes
+    the package creates itself) already carry this styling from their
+    rcParams, so the package no longer calls this. It still mutates the
+    axes so external callers styling axes created without the style sheet
+    get the same spine hiding and tick sizing as before.
+    """
     ax.spines["top"].set_visible(False)
     ax.spines["right"].set_visible(False)
     ax.tick_params(labelsize=THEME["font_size"]["tick"])
@@ -1 +1,70 @@
 """Shared test fixtures for lifecycle-allocation tests."""
+
+import os
+import sys
+
+import matplotlib
+import pytest
+
+from lifecycle_allocation.core.allocation import recommended_stock_share
+from lifecycle_allocation.core.models import AllocationResult, InvestorProfile, MarketAssumptions
+from lifecycle_allocation.core.strategies import compare_strategies
+
+# Select the headless backend once for the whole session, before any
+# test module touches pyplot
+matplotlib.use("Agg")
+
+# The smoke tests only assert that figures exist and saved files are
+# non-empty, so render at low resolution: fewer raster bytes per draw
+# and save. setdefault keeps an explicit override from the caller.
+os.environ.setdefault("LIFECYCLE_SAVE_DPI", "50")
+matplotlib.rcParams["figure.dpi"] = 50
+
+
+@pytest.fixture(scope="module")
+def default_profile() -> InvestorProfile:
+    """The standard mid-career profile used across test modules."""
+    return InvestorProfile(
+        age=30,
+        retirement_age=67,
+        investable_wealth=100_000.0,
+        after_tax_income=70_000.0,
+        risk_tolerance=5,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_market() -> MarketAssumptions:
+    """One default MarketAssumptions for the whole session.
+
+    The spec is frozen, so sharing is safe, and constructing it once
+    skips the repeated validator runs a per-test instance would pay.
+    """
+    return MarketAssumptions()
+
+
+@pytest.fixture(scope="module")
+def allocation_result(
+    default_profile: InvestorProfile, default_market: MarketAssumptions
+) -> AllocationResult:
+    """One recommended_stock_share() result per module; the result is immutable."""
+    return recommended_stock_share(default_profile, default_market)
+
+
+@pytest.fixture(scope="module")
+def strategy_df(default_profile: InvestorProfile, default_market: MarketAssumptions):
+    """One compare_strategies() frame per module instead of per test."""
+    return compare_strategies(default_profile, default_market)
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close any figures a test left behind.
+
+    Keeps the pyplot figure registry from accumulating across the
+    session. Pyplot is only touched if a test actually imported it.
+    """
+    yield
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is not None:
+        plt.close("all")
@@ -2,7 +2,11 @@
 
 import pytest
 
-from lifecycle_allocation.core.allocation import alpha_star, recommended_stock_share
+from lifecycle_allocation.core.allocation import (
+    alpha_star,
+    batch_recommended_stock_share,
+    recommended_stock_share,
+)
 from lifecycle_allocation.core.models import (
     ConstraintsSpec,
     HumanCapitalSpec,
@@ -10,6 +14,14 @@ from lifecycle_allocation.core.models import (
     MarketAssumptions,
 )
 
+_PROFILE_DEFAULTS = dict(
+    age=30,
+    retirement_age=67,
+    investable_wealth=100_000.0,
+    after_tax_income=70_000.0,
+    risk_tolerance=5,
+)
+
 
 class TestAlphaStar:
     def test_basic_computation(self) -> None:
@@ -95,23 +107,14 @@ class TestAlphaStar:
         # Log return adds 0.5*sigma^2 to numerator, so it's higher
         assert a_log > a_merton
 
-    def test_unknown_variant_raises(self) -> None:
-        market = MarketAssumptions()
+    def test_unknown_variant_raises(self, default_market) -> None:
         with pytest.raises(ValueError, match="Unknown alpha_star variant"):
-            alpha_star(market, gamma=4.0, variant="unknown")
+            alpha_star(default_market, gamma=4.0, variant="unknown")
 
 
 class TestRecommendedStockShare:
     def _simple_profile(self, **kwargs: object) -> InvestorProfile:
-        defaults = dict(
-            age=30,
-            retirement_age=67,
-            investable_wealth=100_000.0,
-            after_tax_income=70_000.0,
-            risk_tolerance=5,
-        )
-        defaults.update(kwargs)
-        return InvestorProfile(**defaults)  # type: ignore[arg-type]
+        return InvestorProfile(**{**_PROFILE_DEFAULTS, **kwargs})  # type: ignore[arg-type]
 
     def test_with_zero_human_capital(self) -> None:
         # Retired person with no benefits -> H = 0
@@ -158,17 +161,15 @@ class TestRecommendedStockShare:
         # With huge H/W and aggressive params, should push above 1
         assert result.alpha_unconstrained > 1.0
 
-    def test_result_has_explanation(self) -> None:
+    def test_result_has_explanation(self, default_market) -> None:
         profile = self._simple_profile()
-        market = MarketAssumptions()
-        result = recommended_stock_share(profile, market)
+        result = recommended_stock_share(profile, default_market)
         assert "Lifecycle Allocation" in result.explain
         assert "Disclaimer" in result.explain
 
-    def test_result_components_populated(self) -> None:
+    def test_result_components_populated(self, default_market) -> None:
         profile = self._simple_profile()
-        market = MarketAssumptions()
-        result = recommended_stock_share(profile, market)
+        result = recommended_stock_share(profile, default_market)
         assert "human_capital" in result.components
         assert "gamma" in result.components
         assert "hw_ratio" in result.components
@@ -176,16 +177,12 @@ class TestRecommendedStockShare:
 
 class TestBetaAdjustedAllocation:
     def _simple_profile(self, beta: float = 0.0, **kwargs: object) -> InvestorProfile:
-        defaults = dict(
-            age=30,
-            retirement_age=67,
-            investable_wealth=100_000.0,
-            after_tax_income=70_000.0,
-            risk_tolerance=5,
-            human_capital_model=HumanCapitalSpec(beta=beta),
-        )
-        defaults.update(kwargs)
-        return InvestorProfile(**defaults)  # type: ignore[arg-type]
+        merged = {
+            **_PROFILE_DEFAULTS,
+            "human_capital_model": HumanCapitalSpec(beta=beta),
+            **kwargs,
+        }
+        return InvestorProfile(**merged)  # type: ignore[arg-type]
 
     def test_beta_zero_matches_original(self) -> None:
         """beta=0 should produce the same result as the standard model."""
@@ -235,11 +232,10 @@ class TestBetaAdjustedAllocation:
             assert r.alpha_unconstrained <= prev + 1e-12
             prev = r.alpha_unconstrained
 
-    def test_components_contain_beta_keys(self) -> None:
+    def test_components_contain_beta_keys(self, default_market) -> None:
         """Components dict should contain human capital beta decomposition."""
         profile = self._simple_profile(beta=0.5)
-        market = MarketAssumptions()
-        result = recommended_stock_share(profile, market)
+        result = recommended_stock_share(profile, default_market)
         assert "human_capital_beta" in result.components
         assert "human_capital_bond_like" in result.components
         assert "human_capital_equity_like" in result.components
@@ -255,3 +251,45 @@ class TestBetaAdjustedAllocation:
     def test_validation_rejects_beta_above_one(self) -> None:
         with pytest.raises(ValueError, match="human_capital beta must be in"):
             HumanCapitalSpec(beta=1.1)
+
+
+class TestBatchRecommendedStockShare:
+    def test_matches_scalar_results(self) -> None:
+        market = MarketAssumptions(mu=0.05, r=0.02, sigma=0.18)
+        profiles = [
+            InvestorProfile(
+                age=age,
+                retirement_age=67,
+                investable_wealth=100_000.0,
+                after_tax_income=70_000.0,
+                risk_tolerance=5,
+            )
+            for age in [30, 40, 50, 60]
+        ]
+        batch = batch_recommended_stock_share(profiles, market)
+        scalar = [recommended_stock_share(p, market).alpha_recommended for p in profiles]
+        assert batch == pytest.approx(scalar)
+
+    def test_per_profile_markets(self) -> None:
+        profile = InvestorProfile(
+            age=40,
+            retirement_age=67,
+            investable_wealth=500_000.0,
+            after_tax_income=100_000.0,
+            risk_tolerance=5,
+        )
+        markets = [MarketAssumptions(mu=mu, r=0.02, sigma=0.18) for mu in [0.04, 0.06]]
+        batch = batch_recommended_stock_share([profile, profile], markets)
+        assert batch.shape == (2,)
+        assert batch[0] <= batch[1]
+
+    def test_length_mismatch_raises(self) -> None:
+        profile = InvestorProfile(
+            age=40,
+            retirement_age=67,
+            investable_wealth=500_000.0,
+            risk_tolerance=5,
+        )
+        markets = [MarketAssumptions(), MarketAssumptions()]
+        with pytest.raises(ValueError, match="length"):
+            batch_recommended_stock_share([profile], markets)
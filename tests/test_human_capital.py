@@ -3,6 +3,7 @@
 import os
 import tempfile
 
+import numpy as np
 import pytest
 
 from lifecycle_allocation.core.human_capital import (
@@ -11,7 +12,7 @@ from lifecycle_allocation.core.human_capital import (
     human_capital_pv,
     suggested_beta,
 )
-from lifecycle_allocation.core.income_models import expected_income
+from lifecycle_allocation.core.income_models import expected_income, expected_income_vec
 from lifecycle_allocation.core.models import (
     BenefitModelSpec,
     DiscountCurveSpec,
@@ -106,6 +107,39 @@ class TestCSVIncomeModel:
                 os.unlink(f.name)
 
 
+class TestExpectedIncomeVec:
+    def test_matches_scalar_flat(self) -> None:
+        profile = _make_profile()
+        spec = IncomeModelSpec(type="flat")
+        ages = np.arange(31, 101)
+        vec = expected_income_vec(ages, spec, profile)
+        for age, v in zip(ages, vec):
+            assert v == pytest.approx(expected_income(int(age), spec, profile))
+
+    def test_matches_scalar_growth(self) -> None:
+        profile = _make_profile(age=30, after_tax_income=50_000.0)
+        spec = IncomeModelSpec(type="growth", g=0.03)
+        ages = np.arange(31, 101)
+        vec = expected_income_vec(ages, spec, profile)
+        for age, v in zip(ages, vec):
+            assert v == pytest.approx(expected_income(int(age), spec, profile))
+
+    def test_matches_scalar_profile(self) -> None:
+        profile = _make_profile(age=25, after_tax_income=50_000.0)
+        spec = IncomeModelSpec(type="profile", education="college")
+        ages = np.arange(26, 101)
+        vec = expected_income_vec(ages, spec, profile)
+        for age, v in zip(ages, vec):
+            assert v == pytest.approx(expected_income(int(age), spec, profile))
+
+    def test_zero_at_and_after_retirement(self) -> None:
+        profile = _make_profile()
+        spec = IncomeModelSpec(type="growth", g=0.02)
+        ages = np.arange(60, 80)
+        vec = expected_income_vec(ages, spec, profile)
+        assert (vec[ages >= profile.retirement_age] == 0.0).all()
+
+
 class TestHumanCapitalPV:
     def test_flat_income_constant_discount_closed_form(self) -> None:
         """Flat income Y, constant rate r, no mortality, N years to retirement.
@@ -1,5 +1,6 @@
 """Tests for core data models."""
 
+import numpy as np
 import pytest
 
 from lifecycle_allocation.core.models import (
@@ -13,6 +14,9 @@ from lifecycle_allocation.core.models import (
     risk_tolerance_to_gamma,
 )
 
+# Computed once for the whole module; the mapping is deterministic
+_GAMMAS = np.array([risk_tolerance_to_gamma(rt) for rt in range(1, 11)])
+
 
 class TestRiskToleranceToGamma:
     def test_rt_1_gives_gamma_10(self) -> None:
@@ -26,17 +30,12 @@ class TestRiskToleranceToGamma:
         assert risk_tolerance_to_gamma(5) == pytest.approx(expected, rel=1e-6)
 
     def test_monotonically_decreasing(self) -> None:
-        gammas = [risk_tolerance_to_gamma(rt) for rt in range(1, 11)]
-        for i in range(len(gammas) - 1):
-            assert gammas[i] > gammas[i + 1]
-
-    def test_rt_0_raises(self) -> None:
-        with pytest.raises(ValueError, match="between 1 and 10"):
-            risk_tolerance_to_gamma(0)
+        assert np.all(np.diff(_GAMMAS) < 0)
 
-    def test_rt_11_raises(self) -> None:
+    @pytest.mark.parametrize("rt", [0, 11])
+    def test_out_of_range_raises(self, rt: int) -> None:
         with pytest.raises(ValueError, match="between 1 and 10"):
-            risk_tolerance_to_gamma(11)
+            risk_tolerance_to_gamma(rt)
 
 
 class TestInvestorProfile:
@@ -118,18 +117,29 @@ class TestConstraintsSpec:
 
 
 class TestSubModelSpecs:
-    def test_invalid_income_type_raises(self) -> None:
-        with pytest.raises(ValueError, match="income_model type"):
-            IncomeModelSpec(type="invalid")
-
-    def test_invalid_benefit_type_raises(self) -> None:
-        with pytest.raises(ValueError, match="benefit_model type"):
-            BenefitModelSpec(type="invalid")
-
-    def test_invalid_mortality_type_raises(self) -> None:
-        with pytest.raises(ValueError, match="mortality_model type"):
-            MortalitySpec(type="invalid")
-
-    def test_invalid_discount_type_raises(self) -> None:
-        with pytest.raises(ValueError, match="discount_curve type"):
-            DiscountCurveSpec(type="invalid")
+    @pytest.mark.parametrize(
+        "cls,regex",
+        [
+            (IncomeModelSpec, "income_model type"),
+            (BenefitModelSpec, "benefit_model type"),
+            (MortalitySpec, "mortality_model type"),
+            (DiscountCurveSpec, "discount_curve type"),
+        ],
+    )
+    def test_invalid_type_raises(self, cls: type, regex: str) -> None:
+        with pytest.raises(ValueError, match=regex):
+            cls(type="invalid")
+
+
+class TestModelClassIdentity:
+    """The model classes must exist exactly once, in core.models."""
+
+    def test_classes_defined_in_core_models(self) -> None:
+        assert InvestorProfile.__module__ == "lifecycle_allocation.core.models"
+        assert IncomeModelSpec.__module__ == "lifecycle_allocation.core.models"
+
+    def test_package_reexports_same_objects(self) -> None:
+        import lifecycle_allocation
+
+        assert lifecycle_allocation.InvestorProfile is InvestorProfile
+        assert lifecycle_allocation.IncomeModelSpec is IncomeModelSpec
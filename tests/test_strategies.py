@@ -1,16 +1,16 @@
 """Tests for reference strategies."""
 
+import numpy as np
 import pytest
 
-from lifecycle_allocation.core.models import (
-    InvestorProfile,
-    MarketAssumptions,
-)
 from lifecycle_allocation.core.strategies import (
     compare_strategies,
     strategy_n_minus_age,
+    strategy_n_minus_age_vec,
     strategy_parametric_tdf,
+    strategy_parametric_tdf_vec,
     strategy_sixty_forty,
+    strategy_sixty_forty_vec,
 )
 
 
@@ -46,54 +46,50 @@ class TestParametricTDF:
         assert strategy_parametric_tdf(90) == pytest.approx(0.30)
 
     def test_monotonically_decreasing(self) -> None:
-        allocs = [strategy_parametric_tdf(age) for age in range(22, 91)]
-        for i in range(len(allocs) - 1):
-            assert allocs[i] >= allocs[i + 1]
+        allocs = strategy_parametric_tdf_vec(np.arange(22, 91))
+        assert np.all(np.diff(allocs) <= 1e-12)
 
     def test_values_in_range(self) -> None:
-        for age in range(20, 100):
-            a = strategy_parametric_tdf(age)
-            assert 0.0 <= a <= 1.0
+        allocs = strategy_parametric_tdf_vec(np.arange(20, 100))
+        assert np.all((allocs >= 0.0) & (allocs <= 1.0))
+
+    def test_retirement_age_beyond_90(self) -> None:
+        # Out-of-band retirement ages must not corrupt the glide path
+        assert strategy_parametric_tdf(92, retirement_age=95) == pytest.approx(0.30)
+        assert strategy_parametric_tdf(22, retirement_age=95) == pytest.approx(0.90)
 
 
 class TestCompareStrategies:
-    def test_returns_dataframe_with_at_least_4_rows(self) -> None:
-        profile = InvestorProfile(
-            age=30,
-            retirement_age=67,
-            investable_wealth=100_000.0,
-            after_tax_income=70_000.0,
-            risk_tolerance=5,
-        )
-        market = MarketAssumptions()
-        df = compare_strategies(profile, market)
-        assert len(df) >= 4
-        assert "strategy" in df.columns
-        assert "allocation" in df.columns
-        assert "description" in df.columns
-
-    def test_all_allocations_are_valid(self) -> None:
-        profile = InvestorProfile(
-            age=30,
-            retirement_age=67,
-            investable_wealth=100_000.0,
-            after_tax_income=70_000.0,
-            risk_tolerance=5,
-        )
-        market = MarketAssumptions()
-        df = compare_strategies(profile, market)
-        for alloc in df["allocation"]:
-            assert 0.0 <= alloc <= 2.0  # generous upper bound
-
-    def test_user_supplied_strategies(self) -> None:
-        profile = InvestorProfile(
-            age=30,
-            retirement_age=67,
-            investable_wealth=100_000.0,
-            after_tax_income=70_000.0,
-            risk_tolerance=5,
-        )
-        market = MarketAssumptions()
-        df = compare_strategies(profile, market, strategies={"My Strategy": 0.75})
+    def test_returns_dataframe_with_at_least_4_rows(self, strategy_df) -> None:
+        assert len(strategy_df) >= 4
+        assert "strategy" in strategy_df.columns
+        assert "allocation" in strategy_df.columns
+        assert "description" in strategy_df.columns
+
+    def test_all_allocations_are_valid(self, strategy_df) -> None:
+        allocs = strategy_df["allocation"].to_numpy(dtype=np.float64, copy=False)
+        assert allocs.size >= 4
+        # Generous upper bound; one fused mask instead of a per-row loop
+        assert np.all((allocs >= 0.0) & (allocs <= 2.0)), allocs
+
+    def test_user_supplied_strategies(self, default_profile, default_market) -> None:
+        df = compare_strategies(default_profile, default_market, strategies={"My Strategy": 0.75})
         assert len(df) >= 5
-        assert "My Strategy" in df["strategy"].values
+        assert (df["strategy"] == "My Strategy").any()
+
+
+class TestVectorizedStrategies:
+    def test_sixty_forty_vec_matches_scalar(self) -> None:
+        ages = np.array([22, 30, 50, 70, 90])
+        expected = [strategy_sixty_forty(int(a)) for a in ages]
+        assert strategy_sixty_forty_vec(ages).tolist() == expected
+
+    def test_n_minus_age_vec_matches_scalar(self) -> None:
+        ages = np.array([0, 30, 60, 110])
+        expected = [strategy_n_minus_age(int(a)) for a in ages]
+        assert strategy_n_minus_age_vec(ages).tolist() == pytest.approx(expected)
+
+    def test_parametric_tdf_vec_matches_scalar(self) -> None:
+        ages = np.arange(22, 100)
+        expected = [strategy_parametric_tdf(int(a)) for a in ages]
+        assert strategy_parametric_tdf_vec(ages).tolist() == pytest.approx(expected)
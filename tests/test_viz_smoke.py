@@ -1,80 +1,50 @@
 """Smoke tests for visualization functions."""
 
-import os
-import tempfile
-
-import matplotlib
-
-matplotlib.use("Agg")
-
 from lifecycle_allocation.core.allocation import recommended_stock_share
 from lifecycle_allocation.core.models import (
     InvestorProfile,
-    MarketAssumptions,
 )
-from lifecycle_allocation.core.strategies import compare_strategies
 from lifecycle_allocation.viz.charts import plot_balance_sheet, plot_strategy_bars
 
+_PROFILE_DEFAULTS = dict(
+    age=30,
+    retirement_age=67,
+    investable_wealth=100_000.0,
+    after_tax_income=70_000.0,
+    risk_tolerance=5,
+)
+
 
 def _make_profile(**kwargs: object) -> InvestorProfile:
-    defaults = dict(
-        age=30,
-        retirement_age=67,
-        investable_wealth=100_000.0,
-        after_tax_income=70_000.0,
-        risk_tolerance=5,
-    )
-    defaults.update(kwargs)
-    return InvestorProfile(**defaults)  # type: ignore[arg-type]
+    return InvestorProfile(**{**_PROFILE_DEFAULTS, **kwargs})  # type: ignore[arg-type]
 
 
 class TestPlotBalanceSheet:
-    def test_produces_figure(self) -> None:
-        profile = _make_profile()
-        market = MarketAssumptions()
-        result = recommended_stock_share(profile, market)
-        fig = plot_balance_sheet(result, profile)
+    def test_produces_figure(self, allocation_result, default_profile) -> None:
+        fig = plot_balance_sheet(allocation_result, default_profile)
         assert fig is not None
 
-    def test_saves_to_file(self) -> None:
-        profile = _make_profile()
-        market = MarketAssumptions()
-        result = recommended_stock_share(profile, market)
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
-        try:
-            plot_balance_sheet(result, profile, save_path=path)
-            assert os.path.getsize(path) > 0
-        finally:
-            os.unlink(path)
+    def test_saves_to_file(self, allocation_result, default_profile, tmp_path) -> None:
+        path = tmp_path / "balance_sheet.png"
+        plot_balance_sheet(allocation_result, default_profile, save_path=path)
+        assert path.stat().st_size > 0
 
-    def test_zero_human_capital(self) -> None:
+    def test_zero_human_capital(self, default_market) -> None:
         profile = _make_profile(age=70, retirement_age=67)
-        market = MarketAssumptions()
-        result = recommended_stock_share(profile, market)
+        result = recommended_stock_share(profile, default_market)
         fig = plot_balance_sheet(result, profile)
         assert fig is not None
 
 
 class TestPlotStrategyBars:
-    def test_produces_figure(self) -> None:
-        profile = _make_profile()
-        market = MarketAssumptions()
-        df = compare_strategies(profile, market)
-        fig = plot_strategy_bars(df)
+    def test_produces_figure(self, strategy_df) -> None:
+        fig = plot_strategy_bars(strategy_df)
         assert fig is not None
 
-    def test_saves_to_file(self) -> None:
-        profile = _make_profile()
-        market = MarketAssumptions()
-        df = compare_strategies(profile, market)
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            path = f.name
-        try:
-            plot_strategy_bars(df, save_path=path)
-            assert os.path.getsize(path) > 0
-        finally:
-            os.unlink(path)
+    def test_saves_to_file(self, strategy_df, tmp_path) -> None:
+        path = tmp_path / "strategy_bars.png"
+        plot_strategy_bars(strategy_df, save_path=path)
+        assert path.stat().st_size > 0
 
     def test_all_strategies_equal(self) -> None:
         import pandas as pd